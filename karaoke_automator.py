@@ -54,8 +54,8 @@ class KaraokeVersionAutomator:
         
         # Initialize browser manager
         self.chrome_manager = ChromeManager(headless=headless)
+        self.chrome_manager.setup_folders()  # Chrome's download directory must exist at launch
         self.chrome_manager.setup_driver()
-        self.chrome_manager.setup_folders()
         
         # Get driver and wait from chrome manager
         self.driver = self.chrome_manager.driver
@@ -615,9 +615,7 @@ if __name__ == "__main__":
     # Handle session clearing
     if args.clear_session:
         from packages.authentication import LoginManager
-        # Create a temporary login manager just to clear session
-        temp_login = LoginManager(None, None)
-        if temp_login.clear_session():
+        if LoginManager.clear_session_file():
             print("✅ Saved session data cleared successfully")
         else:
             print("❌ Could not clear session data")
@@ -1,18 +1,26 @@
 """Login management for Karaoke-Version.com authentication"""
 
+import os
+import re
+import json
 import time
 import logging
-import pickle
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, Union
+import requests
+import urllib3
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.remote.client_config import ClientConfig
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import (
-    TimeoutException, 
-    NoSuchElementException, 
-    ElementNotInteractableException,
-    ElementClickInterceptedException,
-    WebDriverException,
-    StaleElementReferenceException
+    StaleElementReferenceException, TimeoutException, WebDriverException
 )
 
 try:
@@ -23,179 +31,399 @@ except ImportError:
     PASSWORD = None
 
 from packages.utils import selenium_safe, validation_safe, profile_timing, profile_selenium
-from packages.configuration.config import SESSION_MAX_AGE_SECONDS
+from packages.configuration.config import (
+    SESSION_MAX_AGE_SECONDS, LOGIN_URL, HTTP_LOGIN_ENABLED, DIRECT_LOGOUT_ENABLED,
+    WEBDRIVER_DEFAULT_TIMEOUT, WEBDRIVER_POLL_FREQUENCY, WEBDRIVER_CONNECTION_POOL_SIZE
+)
+
+# Ordered (css_selector, text) candidates for _find_first_visible(); earlier
+# entries win. Built once at import rather than on every lookup.
+_USERNAME_SELECTORS = (
+    ("[name='frm_login']", None),  # Working selector for Karaoke-Version.com
+    ("[name='email']", None),
+    ("[name='username']", None),
+    ("#email", None),
+    ("input[type='email']", None),
+)
+_PASSWORD_SELECTORS = (
+    ("[name='frm_password']", None),  # Working selector for Karaoke-Version.com
+    ("[name='password']", None),
+    ("input[type='password']", None),
+)
+_SUBMIT_SELECTORS = (
+    ("[name='sbm']", None),  # Working selector for Karaoke-Version.com
+    ("input[type='submit']", None),
+    ("button[type='submit']", None),
+)
+_LOGIN_LINK_SELECTORS = (
+    ("a", "Log in"),  # Working selector
+    ("a", "Log In"),
+    ("a", "Login"),
+    ("a", "Sign In"),
+)
+# Used only if the logout URL doesn't log out
+_LOGOUT_LINK_SELECTORS = (
+    ('a[href*="logout"]', None),
+    ('a[href*="signout"]', None),
+)
+# Any username candidate, as one CSS union for explicit waits
+_USERNAME_CSS = ", ".join(selector for selector, _ in _USERNAME_SELECTORS)
+# Any logout link; only rendered for logged-in members
+_LOGOUT_CSS = ", ".join(selector for selector, _ in _LOGOUT_LINK_SELECTORS)
+# Locators for explicit waits: a loaded page, and the login form being shown
+_BODY_LOCATOR = (By.TAG_NAME, "body")
+_LOGIN_FORM_LOCATOR = (By.NAME, "frm_login")
+_USERNAME_LOCATOR = (By.CSS_SELECTOR, _USERNAME_CSS)
+
+_HOMEPAGE_URL = "https://www.karaoke-version.com"
+_ACCOUNT_URL = f"{_HOMEPAGE_URL}/my/index.html"
+# Logging out is a plain GET of this page; cookie clearing is the fallback
+_LOGOUT_URL = f"{_HOMEPAGE_URL}/my/logout.html"
+
+# Cookie attributes WebDriver's add_cookie accepts
+_COOKIE_KEYS = frozenset(('name', 'value', 'path', 'domain', 'secure', 'httpOnly', 'expiry', 'sameSite'))
+
+# In-page scripts for the single round-trip lookups below
+_PAGE_STATE_JS = "var logoutCss = " + json.dumps(_LOGOUT_CSS) + ";" + """
+    function matches(xpath) {
+        return document.evaluate(xpath, document, null,
+                                 XPathResult.BOOLEAN_TYPE, null).booleanValue;
+    }
+    var state = {url: location.href};
+    // A logout link is found by the CSS engine; the text XPaths walk the
+    // whole DOM, so they only run when it is missing
+    state.hasLogoutLink = document.querySelector(logoutCss) !== null;
+    state.hasMyAccount = state.hasLogoutLink ||
+        matches("boolean(//*[contains(text(), 'My Account')])");
+    state.hasLoginLink = !state.hasMyAccount &&
+        matches("boolean(//a[contains(text(), 'Log in')])");
+    state.loggedIn = state.hasMyAccount || !state.hasLoginLink;
+    // An element passed in (e.g. the clicked submit button) reports whether it left the page
+    if (arguments[0]) {
+        state.detached = !arguments[0].isConnected;
+    }
+    return state;
+"""
+_FIRST_VISIBLE_JS = """
+    var candidates = arguments[0];
+    for (var i = 0; i < candidates.length; i++) {
+        var elements = document.querySelectorAll(candidates[i][0]);
+        var text = candidates[i][1];
+        for (var j = 0; j < elements.length; j++) {
+            var el = elements[j];
+            if (text && el.textContent.indexOf(text) === -1) {
+                continue;
+            }
+            var rect = el.getBoundingClientRect();
+            if (rect.width > 0 && rect.height > 0) {
+                return el;
+            }
+        }
+    }
+    return null;
+"""
+_FILL_CREDENTIALS_JS = """
+    var fields = [arguments[0], arguments[1]];
+    var values = [arguments[2], arguments[3]];
+    for (var i = 0; i < fields.length; i++) {
+        fields[i].value = values[i];
+        fields[i].dispatchEvent(new Event('input', {bubbles: true}));
+        fields[i].dispatchEvent(new Event('change', {bubbles: true}));
+    }
+"""
+_SESSION_STATE_JS = """
+    function dump(storage) {
+        var items = {};
+        try {
+            for (var i = 0; i < storage.length; i++) {
+                var key = storage.key(i);
+                items[key] = storage.getItem(key);
+            }
+        } catch (e) {
+            // Storage can be unavailable (e.g. on about:blank)
+        }
+        return items;
+    }
+    return {
+        url: location.href,
+        localStorage: dump(window.localStorage),
+        sessionStorage: dump(window.sessionStorage)
+    };
+"""
+_RESTORE_STORAGE_JS = """
+    var stores = [window.localStorage, window.sessionStorage];
+    for (var i = 0; i < stores.length; i++) {
+        var items = arguments[i];
+        for (var key in items) {
+            stores[i].setItem(key, items[key]);
+        }
+    }
+"""
+
+# How long (seconds) an is_logged_in() result is reused outside login()
+_LOGIN_STATE_TTL_SECONDS = 1.0
+
+# Window (seconds) in which login() reuses a homepage loaded by a previous call
+_HOMEPAGE_REUSE_SECONDS = 30
+
+# Layout version of the session file; files written with another version are ignored
+_SESSION_SCHEMA_VERSION = 1
+
+# Timeout (seconds) for each request made by _login_via_http()
+_HTTP_LOGIN_TIMEOUT = 15
+
+# Hidden <input> fields of the login page (e.g. CSRF tokens) that must be
+# echoed back with the credentials
+_HIDDEN_INPUT_RE = re.compile(r"<input[^>]*type=[\"']hidden[\"'][^>]*>", re.IGNORECASE)
+_INPUT_ATTR_RE = re.compile(r"\b(name|value)=[\"']([^\"']*)[\"']", re.IGNORECASE)
+
+
+class _AttachedRemote(webdriver.Remote):
+    """Remote driver that adopts a running browser session instead of starting one"""
+    
+    def __init__(self, command_executor: str, session_id: str) -> None:
+        self._attach_session_id = session_id
+        client_config = ClientConfig(
+            remote_server_addr=command_executor,
+            # A dead or unreachable session must fail rather than hang attach()
+            timeout=WEBDRIVER_DEFAULT_TIMEOUT,
+            init_args_for_pool_manager={
+                "init_args_for_pool_manager": {"maxsize": WEBDRIVER_CONNECTION_POOL_SIZE}
+            }
+        )
+        super().__init__(command_executor=command_executor, options=Options(),
+                         client_config=client_config)
+    
+    def start_session(self, capabilities: dict) -> None:
+        # Selenium declares session_id as None until a session is started
+        self.session_id = self._attach_session_id  # type: ignore[assignment]
+        self.caps = {}
 
 
 class LoginManager:
     """Handles all login-related functionality for Karaoke-Version.com"""
     
-    def __init__(self, driver, wait, session_file=".cache/session_data.pkl"):
+    # Monotonic time of the last homepage load per browser session id; lets
+    # repeat login() calls sharing a driver skip reloading it
+    _homepage_visits: Dict[Optional[str], float] = {}
+    
+    # Writes session files off the caller's thread; a single worker keeps
+    # writes to the same file in order. Pending writes finish at interpreter exit.
+    _session_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="session-save")
+    
+    def __init__(self, driver: WebDriver, wait: Optional[WebDriverWait],
+                 session_file: str = ".cache/session_data.json",
+                 remember_browser: bool = False) -> None:
         """
         Initialize login manager
         
         Args:
             driver: Selenium WebDriver instance
-            wait: WebDriverWait instance
+            wait: WebDriverWait instance (built with a short poll interval if None)
             session_file: Path to file for storing session data (cookies, etc.)
+            remember_browser: Also save the WebDriver server URL and session id,
+                so a later run can attach() to this browser. Off by default:
+                whoever can read the file can drive the browser while it runs.
         """
+        if wait is None:
+            wait = WebDriverWait(
+                driver, WEBDRIVER_DEFAULT_TIMEOUT, poll_frequency=WEBDRIVER_POLL_FREQUENCY
+            )
         self.driver = driver
         self.wait = wait
+        self.remember_browser = remember_browser
         self.session_file = Path(session_file)
         
-        # Create session storage directory if it doesn't exist
-        self.session_file.parent.mkdir(parents=True, exist_ok=True)
+        # Memoized (monotonic time, logged_in) from the last DOM probe; kept for
+        # the whole of a login() call, otherwise for _LOGIN_STATE_TTL_SECONDS
+        self._login_state_cache: Optional[Tuple[float, bool]] = None
+        self._login_state_scoped = False
+        # Set when cookies were cleared without reloading the page
+        self._needs_reload = False
+        
+        # Session storage directory is created on first save
+        self._session_dir_ready = False
+        # Future of the last background session write, if not yet awaited
+        self._pending_save: Optional[Future] = None
+        # ((mtime_ns, size), data) of the session file as last parsed
+        self._session_cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
     
     @validation_safe(return_value=False, operation_name="login status check")
-    def is_logged_in(self):
-        """Check if user is currently logged in"""
+    def is_logged_in(self) -> bool:
+        """Check if user is currently logged in
+        
+        The result is memoized until the next navigation or click made by
+        this manager - for the whole of a login() call, otherwise only briefly
+        since other managers share the driver - so back-to-back checks don't
+        re-query the DOM.
+        """
+        if self._needs_reload:
+            # Cookies were cleared; the page on screen is stale
+            return False
+        
+        if self._login_state_cache is not None:
+            checked_at, logged_in = self._login_state_cache
+            if (self._login_state_scoped or
+                    time.monotonic() - checked_at < _LOGIN_STATE_TTL_SECONDS):
+                return logged_in
+        
+        logged_in = self._probe_login_state()
+        self._login_state_cache = (time.monotonic(), logged_in)
+        return logged_in
+    
+    def _probe_login_state(self) -> bool:
+        """Query the DOM for login indicators"""
+        state = self._probe_page_state()
+        
         # Primary check: Look for "My Account" in header
-        my_account_elements = self.driver.find_elements(By.XPATH, "//*[contains(text(), 'My Account')]")
-        if my_account_elements:
+        if state.get('hasMyAccount'):
             logging.info("✅ User is logged in: Found 'My Account' in header")
             return True
         
         # Secondary check: No login links present
-        login_links = self.driver.find_elements(By.XPATH, "//a[contains(text(), 'Log in')]")
-        if not login_links:
+        if state.get('loggedIn'):
             logging.info("✅ User appears logged in: No login links found")
             return True
         
         logging.info("❌ User is not logged in")
         return False
     
+    def _probe_page_state(self, watched: Optional[WebElement] = None) -> Dict[str, Any]:
+        """Describe the current page in a single round-trip
+        
+        Args:
+            watched: Optional element to check for removal from the page
+        
+        Returns:
+            dict: loggedIn, hasMyAccount, hasLoginLink and url, plus detached
+            if an element was watched (empty if the script returned nothing)
+        """
+        # Both XPath checks are evaluated in-page as booleans, so no element
+        # lists are serialized back over the wire
+        if watched is None:
+            return self.driver.execute_script(_PAGE_STATE_JS) or {}
+        
+        try:
+            return self.driver.execute_script(_PAGE_STATE_JS, watched) or {}
+        except StaleElementReferenceException:
+            # The element belonged to a document that has since been replaced
+            return dict(self._probe_page_state(), detached=True)
+    
+    def _invalidate_login_state(self) -> None:
+        """Drop the memoized login state after the page may have changed"""
+        self._login_state_cache = None
+    
+    def _find_first_visible(self, candidates: Sequence[Tuple[str, Optional[str]]]) -> Optional[WebElement]:
+        """Return the first visible element among candidates in one round-trip
+        
+        Args:
+            candidates: Ordered (css_selector, text) pairs; text may be None,
+                otherwise the element's text must contain it
+        """
+        return self.driver.execute_script(_FIRST_VISIBLE_JS, candidates)
+    
     @selenium_safe(return_value=False, operation_name="logout")
-    def logout(self):
+    def logout(self) -> bool:
         """Logout from the current session"""
-        if self._attempt_direct_logout():
+        # The logout URL is unconfirmed on the live site; when it is wrong the
+        # verification wait times out before the link is even tried
+        if DIRECT_LOGOUT_ENABLED and self._attempt_direct_logout():
+            return True
+        
+        if self._attempt_logout_link():
             return True
         
         return self._fallback_cookie_logout()
     
-    def _attempt_direct_logout(self):
-        """Attempt to logout using direct logout links"""
-        logout_selectors = [
-            "//a[contains(text(), 'Log out')]",
-            "//a[contains(text(), 'Logout')]", 
-            "//a[contains(text(), 'Sign out')]",
-            "//a[contains(text(), 'My Account')]"
-        ]
-        
-        for selector in logout_selectors:
-            try:
-                element = self.driver.find_element(By.XPATH, selector)
-                if element and element.is_displayed():
-                    if "my account" in element.text.lower():
-                        return self._logout_via_account_menu(element)
-                    else:
-                        return self._direct_logout_click(element)
-            except (Exception, AttributeError, ElementClickInterceptedException) as e:
-                logging.debug(f"Logout selector failed: {e}")
-                continue
+    def _attempt_direct_logout(self) -> bool:
+        """Attempt to logout by loading the site's logout URL"""
+        try:
+            self.driver.get(_LOGOUT_URL)
+            self._invalidate_login_state()
+        except WebDriverException as e:
+            logging.debug(f"Logout page failed: {e}")
+            return False
         
-        return False
+        return self._verify_logout_success()
     
-    def _logout_via_account_menu(self, account_element):
-        """Logout by clicking My Account then logout link"""
-        account_element.click()
+    def _attempt_logout_link(self) -> bool:
+        """Attempt to logout by clicking a logout link on the current page"""
+        element = self._find_first_visible(_LOGOUT_LINK_SELECTORS)
+        if not element:
+            return False
         
         try:
-            self.wait.until(
-                EC.presence_of_element_located((By.XPATH, "//a[contains(text(), 'Log out')]"))
-            )
-        except TimeoutException:
-            pass
-        
-        logout_element = self.driver.find_element(By.XPATH, "//a[contains(text(), 'Log out')]")
-        logout_element.click()
+            element.click()
+            self._invalidate_login_state()
+        except WebDriverException as e:
+            logging.debug(f"Logout link failed: {e}")
+            return False
         
         return self._verify_logout_success()
     
-    def _direct_logout_click(self, logout_element):
-        """Logout by clicking direct logout link"""
-        logout_element.click()
-        return self._verify_logout_success()
-    
-    def _verify_logout_success(self):
+    def _verify_logout_success(self) -> bool:
         """Verify that logout was successful"""
         try:
-            self.wait.until(
-                EC.presence_of_element_located((By.XPATH, "//a[contains(text(), 'Log in')]"))
-            )
+            # Same single-round-trip probe as is_logged_in(), polled until the link shows
+            logged_out = self.wait.until(lambda driver: self._probe_page_state().get('hasLoginLink'))
         except TimeoutException:
-            pass
+            logged_out = False
+        
+        if not logged_out:
+            logging.debug("Login link did not reappear after logout")
+            return False
         
         logging.info("Logout completed")
         return True
     
-    def _fallback_cookie_logout(self):
-        """Fallback logout method using cookie clearing"""
+    def _fallback_cookie_logout(self) -> bool:
+        """Fallback logout method using cookie clearing
+        
+        The page is not refreshed; login() reloads the homepage before
+        using it again (see _needs_reload).
+        """
         logging.info("Direct logout not found, clearing session cookies")
         self.driver.delete_all_cookies()
-        self.driver.refresh()
-        
-        try:
-            self.wait.until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-        except TimeoutException:
-            pass
-        
+        self._needs_reload = True
+        self._invalidate_login_state()
         return True
     
-    def _emergency_cookie_fallback(self):
+    def _emergency_cookie_fallback(self) -> bool:
         """Emergency fallback for logout failures"""
         try:
             self.driver.delete_all_cookies()
-            self.driver.refresh()
-            
-            try:
-                self.wait.until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
-            except TimeoutException:
-                pass
-            
+            self._needs_reload = True
+            self._invalidate_login_state()
             return True
-        except (Exception, WebDriverException) as e:
+        except WebDriverException as e:
             logging.debug(f"Cookie fallback failed: {e}")
             return False
     
-    def click_login_link(self):
+    def click_login_link(self) -> bool:
         """Find and click the login link"""
         try:
-            login_selectors = [
-                "//a[contains(text(), 'Log in')]",  # Working selector
-                "//a[contains(text(), 'Log In')]",
-                "//a[contains(text(), 'Login')]",
-                "//a[contains(text(), 'Sign In')]"
-            ]
-            
-            for selector in login_selectors:
-                try:
-                    element = self.driver.find_element(By.XPATH, selector)
-                    if element and element.is_displayed():
-                        logging.info(f"Clicking login link: '{element.text}'")
-                        element.click()
-                        # Wait for login form to appear
-                        try:
-                            self.wait.until(
-                                EC.presence_of_element_located((By.NAME, "frm_login"))
-                            )
-                        except TimeoutException:
-                            pass
-                        return True
-                except (Exception, NoSuchElementException, ElementNotInteractableException) as e:
-                    logging.debug(f"Login selector failed: {e}")
-                    continue
+            element = self._find_first_visible(_LOGIN_LINK_SELECTORS)
+            if not element:
+                logging.warning("No login link found")
+                return False
             
-            logging.warning("No login link found")
-            return False
+            logging.info(f"Clicking login link: '{element.text}'")
+            element.click()
+            self._invalidate_login_state()
+            # Wait for login form to appear
+            try:
+                self.wait.until(
+                    EC.presence_of_element_located(_LOGIN_FORM_LOCATOR)
+                )
+            except TimeoutException:
+                pass
+            return True
             
-        except Exception as e:
+        except WebDriverException as e:
             logging.error(f"Error clicking login link: {e}")
             return False
     
-    def fill_login_form(self, username, password):
+    def fill_login_form(self, username: str, password: str) -> bool:
         """Fill and submit the login form"""
         try:
             username_field = self._find_username_field()
@@ -214,111 +442,82 @@ class LoginManager:
             
             return self._submit_form(submit_button)
             
-        except Exception as e:
+        except WebDriverException as e:
             logging.error(f"Error filling login form: {e}")
             return False
     
-    def _find_username_field(self):
+    def _find_username_field(self) -> Optional[WebElement]:
         """Find and return the username field element"""
-        username_selectors = [
-            (By.NAME, "frm_login"),  # Working selector for Karaoke-Version.com
-            (By.NAME, "email"),
-            (By.NAME, "username"),
-            (By.ID, "email"),
-            (By.CSS_SELECTOR, "input[type='email']")
-        ]
-        
-        username_field = None
-        for selector_type, selector_value in username_selectors:
-            try:
-                username_field = self.wait.until(
-                    EC.presence_of_element_located((selector_type, selector_value))
-                )
-                if username_field and username_field.is_displayed():
-                    logging.info(f"Found username field: {selector_type} = '{selector_value}'")
-                    break
-            except (TimeoutException, NoSuchElementException, ElementNotInteractableException) as e:
-                logging.debug(f"Username selector failed: {e}")
-                continue
+        username_field = self._find_first_visible(_USERNAME_SELECTORS)
+        if username_field:
+            return username_field
+        
+        # Form may still be rendering - wait once for any candidate to appear
+        try:
+            self.wait.until(
+                EC.presence_of_element_located(_USERNAME_LOCATOR)
+            )
+            username_field = self._find_first_visible(_USERNAME_SELECTORS)
+        except TimeoutException as e:
+            logging.debug(f"Username field wait timed out: {e}")
         
         if not username_field:
             logging.error("Could not find username field")
         
         return username_field
     
-    def _find_password_field(self):
+    def _find_password_field(self) -> Optional[WebElement]:
         """Find and return the password field element"""
-        password_selectors = [
-            (By.NAME, "frm_password"),  # Working selector for Karaoke-Version.com
-            (By.NAME, "password"),
-            (By.CSS_SELECTOR, "input[type='password']")
-        ]
-        
-        password_field = None
-        for selector_type, selector_value in password_selectors:
-            try:
-                password_field = self.driver.find_element(selector_type, selector_value)
-                if password_field and password_field.is_displayed():
-                    logging.info(f"Found password field: {selector_type} = '{selector_value}'")
-                    break
-            except (NoSuchElementException, ElementNotInteractableException) as e:
-                logging.debug(f"Password selector failed: {e}")
-                continue
-        
+        password_field = self._find_first_visible(_PASSWORD_SELECTORS)
         if not password_field:
             logging.error("Could not find password field")
         
         return password_field
     
-    def _fill_credentials(self, username_field, username, password_field, password):
+    def _fill_credentials(self, username_field: WebElement, username: str,
+                          password_field: WebElement, password: str) -> None:
         """Fill username and password fields with credentials"""
         logging.info("Filling in credentials...")
-        username_field.clear()
-        username_field.send_keys(username)
-        password_field.clear()
-        password_field.send_keys(password)
+        # Set both values and notify the form's listeners in a single round-trip
+        self.driver.execute_script(_FILL_CREDENTIALS_JS, username_field, password_field, username, password)
     
-    def _find_submit_button(self):
+    def _find_submit_button(self) -> Optional[WebElement]:
         """Find and return the submit button element"""
-        submit_selectors = [
-            (By.NAME, "sbm"),  # Working selector for Karaoke-Version.com
-            (By.XPATH, "//input[@type='submit']"),
-            (By.XPATH, "//button[@type='submit']")
-        ]
-        
-        submit_button = None
-        for selector_type, selector_value in submit_selectors:
-            try:
-                submit_button = self.driver.find_element(selector_type, selector_value)
-                if submit_button and submit_button.is_displayed():
-                    logging.info(f"Found submit button: {selector_type} = '{selector_value}'")
-                    break
-            except (NoSuchElementException, ElementNotInteractableException) as e:
-                logging.debug(f"Submit selector failed: {e}")
-                continue
-        
+        submit_button = self._find_first_visible(_SUBMIT_SELECTORS)
         if not submit_button:
             logging.error("Could not find submit button")
         
         return submit_button
     
-    def _submit_form(self, submit_button):
+    def _submit_form(self, submit_button: WebElement) -> bool:
         """Submit the login form and wait for processing"""
         submit_button.click()
+        self._invalidate_login_state()
         logging.info("Login form submitted")
         
+        def login_processed(driver: WebDriver) -> Union[Dict[str, Any], Literal[False]]:
+            # One round-trip per poll: the probe also reports whether the button is gone
+            state = self._probe_page_state(submit_button)
+            if state.get('hasMyAccount'):
+                return state
+            # The login page's own 'Log in' link would match until it is replaced
+            if not state.get('detached'):
+                return False
+            if "login" not in state.get('url', 'login').lower() or state.get('hasLoginLink'):
+                return state
+            return False
+        
         try:
-            self.wait.until(
-                lambda driver: "login" not in driver.current_url.lower() or
-                               driver.find_elements(By.XPATH, "//*[contains(text(), 'My Account')]") or
-                               driver.find_elements(By.XPATH, "//a[contains(text(), 'Log in')]")
-            )
+            state = self.wait.until(login_processed)
+            # The final page state doubles as the login check that follows
+            self._login_state_cache = (time.monotonic(), bool(state.get('loggedIn')))
         except TimeoutException:
             logging.debug("Login processing timeout, continuing")
         
         return True
     
-    def login(self, username=None, password=None, force_relogin=False):
+    def login(self, username: Optional[str] = None, password: Optional[str] = None,
+              force_relogin: bool = False) -> bool:
         """Complete login process with optimized login checking
         
         Args:
@@ -338,29 +537,81 @@ class LoginManager:
         
         logging.info("Starting optimized login process...")
         
-        # Navigate to homepage to check current login status
-        self.driver.get("https://www.karaoke-version.com")
-        # Wait for homepage to load
+        self._login_state_scoped = True
         try:
-            self.wait.until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-        except TimeoutException:
-            pass
+            return self._perform_login(username, password, force_relogin)
+        finally:
+            self._login_state_scoped = False
+            self._invalidate_login_state()
+    
+    @classmethod
+    def login_many(cls, sessions: Sequence[Tuple[WebDriver, Optional[WebDriverWait], str]],
+                   credentials: Sequence[Dict[str, Any]]) -> List[bool]:
+        """Log several accounts in concurrently, one browser per account
+        
+        Args:
+            sessions: (driver, wait, session_file) per account; each account
+                needs its own driver and session file
+            credentials: login() keyword arguments per account, same order
+        
+        Returns:
+            list: login() result per account
+        """
+        if len(sessions) != len(credentials):
+            raise ValueError(f"Got {len(sessions)} sessions for {len(credentials)} credentials")
+        if not sessions:
+            return []
+        
+        # Each driver talks to its own browser, so logins only wait on I/O
+        with ThreadPoolExecutor(max_workers=len(sessions)) as executor:
+            return list(executor.map(
+                lambda pair: cls(*pair[0]).login(**pair[1]),
+                zip(sessions, credentials)
+            ))
+    
+    def _perform_login(self, username: str, password: str, force_relogin: bool) -> bool:
+        """Run the login steps; login state checks are memoized per page"""
+        if force_relogin or self._needs_reload or not self._homepage_recently_loaded():
+            # Navigate to homepage to check current login status
+            self._load_homepage()
+        else:
+            logging.debug("Homepage loaded moments ago - checking login status on current page")
+        
+        # Probe the login state once; every branch below reuses it
+        currently_logged_in = self.is_logged_in()
         
         # Check if already logged in (unless forced)
-        if not force_relogin and self.is_logged_in():
+        if currently_logged_in and not force_relogin:
             logging.info("✅ Already logged in - skipping login process")
             logging.info("💡 Use force_relogin=True to force re-authentication")
             return True
         
+        return self._login_after_check(username, password, force_relogin, currently_logged_in)
+    
+    def _login_after_check(self, username: str, password: str, force_relogin: bool = False,
+                           currently_logged_in: bool = False) -> bool:
+        """Log in once the caller has loaded the site and probed the login state"""
+        # Reuse a saved session before falling back to the full form login
+        if not force_relogin and self.is_session_valid() and self.load_session():
+            logging.info("✅ Restored saved session - skipping login form")
+            return True
+        
         if force_relogin:
             logging.info("🔄 Force re-login requested")
             # If already logged in, need to logout first
-            if self.is_logged_in():
+            if currently_logged_in:
                 logging.info("Already logged in - logging out first for force re-login")
                 if not self.logout():
                     logging.warning("Logout failed, continuing with login attempt")
+                if self._needs_reload:
+                    # Cookie logout leaves the logged-in page on screen
+                    self._load_homepage()
+        
+        # Try a direct HTTP login before driving the login form
+        if HTTP_LOGIN_ENABLED and self._login_via_http(username, password):
+            logging.info("✅ Login successful via HTTP!")
+            self.save_session()
+            return True
         
         # Click login link
         if not self.click_login_link():
@@ -382,61 +633,212 @@ class LoginManager:
             logging.error("❌ Login failed - verification unsuccessful")
             return False
     
-    def save_session(self):
+    def _login_via_http(self, username: str, password: str) -> bool:
+        """Log in with a direct POST and copy the resulting cookies into the browser
+        
+        Returns False (so login() falls back to the form) when the request
+        fails, the POST is not accepted, or the browser does not end up
+        logged in. The browser is only touched once the POST has succeeded.
+        """
+        try:
+            with requests.Session() as http:
+                login_page = http.get(LOGIN_URL, timeout=_HTTP_LOGIN_TIMEOUT)
+                login_page.raise_for_status()
+                # The login page alone sets site cookies; only those the POST
+                # adds or changes can carry the authenticated session
+                anonymous_cookies = {(cookie.name, cookie.value) for cookie in http.cookies}
+                
+                form_data = {}
+                for hidden_input in _HIDDEN_INPUT_RE.findall(login_page.text):
+                    attrs = {k.lower(): v for k, v in _INPUT_ATTR_RE.findall(hidden_input)}
+                    if attrs.get('name'):
+                        form_data[attrs['name']] = attrs.get('value', '')
+                form_data.update({'frm_login': username, 'frm_password': password, 'sbm': '1'})
+                
+                response = http.post(LOGIN_URL, data=form_data, timeout=_HTTP_LOGIN_TIMEOUT)
+                response.raise_for_status()
+                
+                # A rejected login re-renders the form; an accepted one redirects away
+                if not response.history or "login" in (response.url or "").lower():
+                    logging.debug("HTTP login was not accepted (no redirect away from login page)")
+                    return False
+                
+                session_cookies = [
+                    cookie for cookie in http.cookies
+                    if "karaoke-version.com" in (cookie.domain or "")
+                    and (cookie.name, cookie.value) not in anonymous_cookies
+                ]
+        except requests.RequestException as e:
+            logging.debug(f"HTTP login failed: {e}")
+            return False
+        
+        if not session_cookies:
+            logging.debug("HTTP login set no session cookies")
+            return False
+        
+        try:
+            # Cookies can only be added for the domain currently loaded
+            if not (self.driver.current_url or "").startswith(_HOMEPAGE_URL):
+                self.driver.get(_HOMEPAGE_URL)
+            
+            for cookie in session_cookies:
+                self.driver.add_cookie({
+                    'name': cookie.name,
+                    'value': cookie.value,
+                    'domain': cookie.domain,
+                    'path': cookie.path or '/'
+                })
+            
+            self.driver.refresh()
+            self._invalidate_login_state()
+            try:
+                self.wait.until(
+                    EC.presence_of_element_located(_BODY_LOCATOR)
+                )
+            except TimeoutException:
+                pass
+        except WebDriverException as e:
+            logging.debug(f"Could not apply HTTP login cookies: {e}")
+            return False
+        
+        return self.is_logged_in()
+    
+    def _load_homepage(self) -> None:
+        """Navigate to the homepage and wait for it to load"""
+        self.driver.get(_HOMEPAGE_URL)
+        LoginManager._homepage_visits[self.driver.session_id] = time.monotonic()
+        self._needs_reload = False
+        self._invalidate_login_state()
+        # Wait for homepage to load
+        try:
+            self.wait.until(
+                EC.presence_of_element_located(_BODY_LOCATOR)
+            )
+        except TimeoutException:
+            pass
+    
+    def _homepage_recently_loaded(self) -> bool:
+        """Check whether this driver loaded the homepage moments ago and is still on it"""
+        last_visit = LoginManager._homepage_visits.get(self.driver.session_id)
+        if last_visit is None or time.monotonic() - last_visit >= _HOMEPAGE_REUSE_SECONDS:
+            return False
+        
+        return (self.driver.current_url or "").rstrip("/") == _HOMEPAGE_URL
+    
+    def save_session(self) -> bool:
         """Save current browser session data (cookies, localStorage, etc.) to file"""
         try:
-            session_data = {
+            # Page-side state comes back in one round-trip, cookies in another
+            page_state = self.driver.execute_script(_SESSION_STATE_JS) or {}
+            session_data: Dict[str, Any] = {
+                'version': _SESSION_SCHEMA_VERSION,
                 'cookies': self.driver.get_cookies(),
-                'url': self.driver.current_url,
+                'url': page_state.get('url'),
                 'timestamp': time.time(),
-                'user_agent': self.driver.execute_script("return navigator.userAgent"),
-                'window_size': self.driver.get_window_size()
+                'localStorage': page_state.get('localStorage') or {},
+                'sessionStorage': page_state.get('sessionStorage') or {}
             }
             
-            # Try to get localStorage data (actual key-value pairs only)
-            try:
-                local_storage_script = """
-                var storage = {};
-                for (var i = 0; i < localStorage.length; i++) {
-                    var key = localStorage.key(i);
-                    storage[key] = localStorage.getItem(key);
-                }
-                return storage;
-                """
-                local_storage = self.driver.execute_script(local_storage_script)
-                session_data['localStorage'] = local_storage
-            except Exception as e:
-                logging.debug(f"Could not save localStorage: {e}")
-                session_data['localStorage'] = {}
+            webdriver_info = self._webdriver_session_info() if self.remember_browser else None
+            if webdriver_info:
+                session_data['webdriver'] = webdriver_info
             
-            # Try to get sessionStorage data (actual key-value pairs only)
-            try:
-                session_storage_script = """
-                var storage = {};
-                for (var i = 0; i < sessionStorage.length; i++) {
-                    var key = sessionStorage.key(i);
-                    storage[key] = sessionStorage.getItem(key);
-                }
-                return storage;
-                """
-                session_storage = self.driver.execute_script(session_storage_script)
-                session_data['sessionStorage'] = session_storage
-            except Exception as e:
-                logging.debug(f"Could not save sessionStorage: {e}")
-                session_data['sessionStorage'] = {}
+            # Browser state is gathered here; only the disk write is handed off
+            payload = json.dumps(session_data)
+            self._session_cache = None
+            self._pending_save = self._session_writer.submit(
+                self._write_session_file, payload, session_data['timestamp']
+            )
+            return True
             
-            # Save to file
-            with open(self.session_file, 'wb') as f:
-                pickle.dump(session_data, f)
+        except Exception as e:
+            logging.warning("⚠️ Could not save session data: %s", e)
+            return False
+    
+    def _write_session_file(self, payload: str, timestamp: float) -> bool:
+        """Write serialized session data to the session file (runs on _session_writer)"""
+        try:
+            if not self._session_dir_ready:
+                self.session_file.parent.mkdir(parents=True, exist_ok=True)
+                self._session_dir_ready = True
+            
+            # Write to a temp file and swap it in so a crash never leaves a torn file
+            tmp_file = self.session_file.with_name(self.session_file.name + ".tmp")
+            with open(tmp_file, 'w') as f:
+                f.write(payload)
+                f.flush()
+                # Make the data durable before the rename can become visible
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.session_file)
+            # is_session_valid() reads the age from mtime; pin it to the saved timestamp
+            os.utime(self.session_file, (timestamp, timestamp))
             
-            logging.info(f"💾 Session data saved to {self.session_file}")
+            logging.info("💾 Session data saved to %s", self.session_file)
             return True
             
         except Exception as e:
-            logging.warning(f"⚠️ Could not save session data: {e}")
+            logging.warning("⚠️ Could not save session data: %s", e)
             return False
     
-    def load_session(self):
+    def wait_for_session_save(self) -> bool:
+        """Block until queued session writes, from any manager, have finished
+        
+        Returns:
+            bool: False if this manager's last write failed, True otherwise
+        """
+        self._drain_session_writer()
+        pending, self._pending_save = self._pending_save, None
+        return pending.result() if pending is not None else True
+    
+    @classmethod
+    def _drain_session_writer(cls) -> None:
+        """Block until every session write queued so far has finished"""
+        # The writer runs jobs in order, so an empty job marks the end of the queue
+        cls._session_writer.submit(lambda: None).result()
+    
+    def _webdriver_session_info(self) -> Optional[Dict[str, str]]:
+        """Return the WebDriver server URL and session id, for attach()"""
+        executor = self.driver.command_executor
+        if not isinstance(executor, RemoteConnection):
+            return None
+        executor_url = executor.client_config.remote_server_addr
+        session_id = getattr(self.driver, 'session_id', None)
+        if not isinstance(executor_url, str) or not isinstance(session_id, str):
+            return None
+        return {'executor_url': executor_url, 'session_id': session_id}
+    
+    @classmethod
+    def attach(cls, session_file: str = ".cache/session_data.json") -> Optional["LoginManager"]:
+        """Reattach to the browser recorded by save_session(), skipping Chrome startup
+        
+        Only a manager created with remember_browser=True records its browser.
+        
+        Returns:
+            LoginManager driving the still-running browser, or None if no
+            browser was recorded or it is no longer reachable
+        """
+        # A save queued moments ago may still be on its way to disk
+        cls._drain_session_writer()
+        try:
+            webdriver_info = json.loads(Path(session_file).read_text()).get('webdriver')
+        except (OSError, ValueError) as e:
+            logging.debug(f"No session to attach to: {e}")
+            return None
+        if not webdriver_info:
+            return None
+        
+        try:
+            driver = _AttachedRemote(webdriver_info['executor_url'], webdriver_info['session_id'])
+            driver.current_url  # Fails fast if the browser session is gone
+        except (KeyError, WebDriverException, urllib3.exceptions.HTTPError) as e:
+            logging.debug(f"Could not attach to saved browser session: {e}")
+            return None
+        
+        logging.info("♻️ Attached to running browser session")
+        wait = WebDriverWait(driver, WEBDRIVER_DEFAULT_TIMEOUT, poll_frequency=WEBDRIVER_POLL_FREQUENCY)
+        return cls(driver, wait, session_file, remember_browser=True)
+    
+    def load_session(self) -> bool:
         """Load and restore browser session data from file"""
         try:
             session_data = self._load_and_validate_session_data()
@@ -447,80 +849,152 @@ class LoginManager:
             return self._verify_session_restoration()
             
         except Exception as e:
-            logging.warning(f"⚠️ Could not load session data: {e}")
+            logging.warning("⚠️ Could not load session data: %s", e)
             return False
     
-    def _load_and_validate_session_data(self):
+    def _load_and_validate_session_data(self) -> Optional[Dict[str, Any]]:
         """Load session data from file and validate expiry"""
-        if not self.session_file.exists():
+        self.wait_for_session_save()
+        try:
+            file_stat = self.session_file.stat()
+        except OSError:
             logging.debug("No session file found")
             return None
         
-        # Load session data
-        with open(self.session_file, 'rb') as f:
-            session_data = pickle.load(f)
+        # Reuse the parsed file while it is unchanged on disk
+        cache_key = (file_stat.st_mtime_ns, file_stat.st_size)
+        if self._session_cache is not None and self._session_cache[0] == cache_key:
+            session_data = dict(self._session_cache[1])
+        else:
+            try:
+                session_data = json.loads(self.session_file.read_text())
+            except ValueError:
+                logging.info("🗑️ Saved session file is not valid JSON, discarding it")
+                self.clear_session()
+                return None
+            if (not isinstance(session_data, dict) or
+                    session_data.get('version') != _SESSION_SCHEMA_VERSION):
+                logging.info("🗑️ Saved session uses an unsupported format, discarding it")
+                self.clear_session()
+                return None
+            self._session_cache = (cache_key, session_data)
+            session_data = dict(session_data)
         
         # Check if session is not too old (24 hours max)
         session_age = time.time() - session_data.get('timestamp', 0)
         max_age = SESSION_MAX_AGE_SECONDS  # 24 hours in seconds
         
         if session_age > max_age:
-            logging.info(f"🕐 Saved session is {session_age/3600:.1f} hours old, too old to use")
+            logging.info("🕐 Saved session is %.1f hours old, too old to use", session_age / 3600)
             self.clear_session()
             return None
         
-        logging.info(f"🔄 Loading session from {session_age/60:.1f} minutes ago")
+        logging.info("🔄 Loading session from %.1f minutes ago", session_age / 60)
         return session_data
     
-    def _restore_browser_state(self, session_data):
-        """Restore browser cookies, localStorage, and sessionStorage"""
-        # Navigate to the saved URL first
-        saved_url = session_data.get('url', 'https://www.karaoke-version.com')
-        self.driver.get(saved_url)
-        # Wait for page to load before restoring session data
-        try:
-            self.wait.until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-        except TimeoutException:
-            pass
+    def _restore_browser_state(self, session_data: Dict[str, Any]) -> None:
+        """Restore browser cookies, localStorage, and sessionStorage
         
+        Cookies go in before navigating, so a single load of the account page
+        both applies them and shows whether the session is still accepted.
+        """
         self._restore_cookies(session_data.get('cookies', []))
-        self._restore_local_storage(session_data.get('localStorage', {}))
-        self._restore_session_storage(session_data.get('sessionStorage', {}))
         
-        # Refresh page to apply restored session
-        self.driver.refresh()
-        # Wait for page to reload with restored session
+        self.driver.get(_ACCOUNT_URL)
+        self._invalidate_login_state()
         try:
             self.wait.until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
+                EC.presence_of_element_located(_BODY_LOCATOR)
             )
         except TimeoutException:
             pass
+        
+        # Web storage is per-origin, so it can only be written once on the site
+        self._restore_storage(session_data.get('localStorage', {}),
+                              session_data.get('sessionStorage', {}))
     
-    def _restore_cookies(self, cookies):
-        """Restore browser cookies with fallback handling"""
+    def _restore_cookies(self, cookies: List[Dict[str, Any]]) -> None:
+        """Restore browser cookies, in one CDP call where the driver supports it"""
+        # The browser would reject other domains' cookies with InvalidCookieDomain
+        cookies = [cookie for cookie in cookies if self._is_site_cookie(cookie)]
+        if not cookies:
+            return
+        
+        try:
+            # _to_cdp_cookie picks the fields it needs, so no scrubbed copy is made here
+            self.driver.execute_cdp_cmd('Network.setCookies', {
+                'cookies': [self._to_cdp_cookie(cookie) for cookie in cookies]
+            })
+            logging.debug("Restored %d cookies via CDP", len(cookies))
+            return
+        except (AttributeError, WebDriverException) as e:
+            logging.debug("Bulk cookie restore unavailable, adding one by one: %s", e)
+        
+        cookies = self._scrub_cookies(cookies)
+        
+        # add_cookie only accepts cookies for the domain currently loaded
+        if not (self.driver.current_url or "").startswith(_HOMEPAGE_URL):
+            self.driver.get(_HOMEPAGE_URL)
+            self._invalidate_login_state()
+        
         for cookie in cookies:
             try:
-                # Keep all cookie attributes, but handle expiry specially
-                cookie_copy = cookie.copy()
-                
-                # Handle expiry - convert to int if present
-                if 'expiry' in cookie_copy:
-                    try:
-                        cookie_copy['expiry'] = int(cookie_copy['expiry'])
-                    except (ValueError, TypeError) as e:
-                        logging.debug(f"Could not convert expiry to int: {e}")
-                        del cookie_copy['expiry']
-                
-                self.driver.add_cookie(cookie_copy)
-                logging.debug(f"Restored cookie: {cookie.get('name', 'unknown')}")
+                self.driver.add_cookie(cookie)
+                logging.debug("Restored cookie: %s", cookie.get('name', 'unknown'))
             except Exception as e:
-                logging.debug(f"Could not restore cookie {cookie.get('name', 'unknown')}: {e}")
+                logging.debug("Could not restore cookie %s: %s", cookie.get('name', 'unknown'), e)
                 self._restore_cookie_fallback(cookie)
     
-    def _restore_cookie_fallback(self, cookie):
+    @staticmethod
+    def _is_site_cookie(cookie: Dict[str, Any]) -> bool:
+        """Whether a saved cookie belongs to the site (or has no domain set)"""
+        domain = cookie.get('domain') or ""
+        return not domain or "karaoke-version.com" in domain
+    
+    @staticmethod
+    def _scrub_cookies(cookies: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Keep only site cookies and the attributes add_cookie accepts
+        
+        Done once up front so bad cookies don't each cost a failed add_cookie.
+        """
+        scrubbed = []
+        for cookie in cookies:
+            if not LoginManager._is_site_cookie(cookie):
+                continue  # The browser would reject it with InvalidCookieDomain
+            
+            clean = {key: value for key, value in cookie.items() if key in _COOKIE_KEYS}
+            if 'expiry' in clean:
+                try:
+                    clean['expiry'] = int(clean['expiry'])
+                except (ValueError, TypeError):
+                    del clean['expiry']
+            scrubbed.append(clean)
+        return scrubbed
+    
+    @staticmethod
+    def _to_cdp_cookie(cookie: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a Selenium cookie dict to a CDP Network.CookieParam"""
+        cdp_cookie = {
+            'name': cookie.get('name'),
+            'value': cookie.get('value'),
+            'path': cookie.get('path', '/'),
+            'secure': cookie.get('secure', False),
+            'httpOnly': cookie.get('httpOnly', False)
+        }
+        if cookie.get('domain'):
+            cdp_cookie['domain'] = cookie['domain']
+        else:
+            cdp_cookie['url'] = _HOMEPAGE_URL
+        if cookie.get('sameSite'):
+            cdp_cookie['sameSite'] = cookie['sameSite']
+        if 'expiry' in cookie:
+            try:
+                cdp_cookie['expires'] = float(cookie['expiry'])
+            except (ValueError, TypeError):
+                pass
+        return cdp_cookie
+    
+    def _restore_cookie_fallback(self, cookie: Dict[str, Any]) -> None:
         """Fallback cookie restoration with minimal attributes"""
         try:
             minimal_cookie = {
@@ -531,73 +1005,49 @@ class LoginManager:
                 'secure': cookie.get('secure', False)
             }
             self.driver.add_cookie(minimal_cookie)
-            logging.debug(f"Restored cookie with minimal attributes: {cookie.get('name', 'unknown')}")
+            logging.debug("Restored cookie with minimal attributes: %s",
+                          cookie.get('name', 'unknown'))
         except Exception as e:
-            logging.debug(f"Failed to restore cookie even with minimal attributes: {e}")
+            logging.debug("Failed to restore cookie even with minimal attributes: %s", e)
     
-    def _restore_local_storage(self, local_storage):
-        """Restore browser localStorage data"""
-        if local_storage and isinstance(local_storage, dict):
-            for key, value in local_storage.items():
-                try:
-                    # Use JSON.stringify to safely encode the value
-                    self.driver.execute_script(
-                        "window.localStorage.setItem(arguments[0], arguments[1]);", 
-                        key, str(value)
-                    )
-                    logging.debug(f"Restored localStorage: {key}")
-                except Exception as e:
-                    logging.debug(f"Could not restore localStorage item {key}: {e}")
-    
-    def _restore_session_storage(self, session_storage):
-        """Restore browser sessionStorage data"""
-        if session_storage and isinstance(session_storage, dict):
-            for key, value in session_storage.items():
-                try:
-                    # Use arguments to safely pass values to avoid injection issues
-                    self.driver.execute_script(
-                        "window.sessionStorage.setItem(arguments[0], arguments[1]);", 
-                        key, str(value)
-                    )
-                    logging.debug(f"Restored sessionStorage: {key}")
-                except Exception as e:
-                    logging.debug(f"Could not restore sessionStorage item {key}: {e}")
-    
-    def _verify_session_restoration(self):
-        """Verify that session restoration was successful"""
-        # Try accessing a protected area to trigger session validation
-        try:
-            # Navigate to account page which should validate session
-            self.driver.get("https://www.karaoke-version.com/my/index.html")
-            # Wait for account page to load or redirect to login
-            try:
-                self.wait.until(
-                    lambda driver: driver.current_url != "https://www.karaoke-version.com/my/index.html" or
-                                   driver.find_elements(By.TAG_NAME, "body")
-                )
-            except TimeoutException:
-                pass
-            
-            # Check if we were redirected to login page
-            current_url = self.driver.current_url
-            if "login" in current_url.lower() or "signin" in current_url.lower():
-                logging.debug("Redirected to login page, session invalid")
-                return False
-                
-        except Exception as e:
-            logging.debug(f"Error accessing account page: {e}")
+    def _restore_storage(self, local_storage: Dict[str, Any],
+                         session_storage: Dict[str, Any]) -> None:
+        """Restore browser localStorage and sessionStorage in one round-trip"""
+        local_items = local_storage if isinstance(local_storage, dict) else {}
+        session_items = session_storage if isinstance(session_storage, dict) else {}
+        if not local_items and not session_items:
+            return
         
-        # Go back to home page and verify login status
-        self.driver.get("https://www.karaoke-version.com")
-        # Wait for homepage to load for login verification
         try:
-            self.wait.until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
+            # Values are passed as arguments to avoid injection issues
+            self.driver.execute_script(
+                _RESTORE_STORAGE_JS,
+                {key: str(value) for key, value in local_items.items()},
+                {key: str(value) for key, value in session_items.items()}
             )
-        except TimeoutException:
-            pass
+            logging.debug("Restored %d localStorage and %d sessionStorage items",
+                          len(local_items), len(session_items))
+        except Exception as e:
+            logging.debug("Could not restore web storage: %s", e)
+    
+    def _verify_session_restoration(self) -> bool:
+        """Verify that session restoration was successful
         
-        # Verify the session restoration worked by checking login status
+        Expects the account page to have just been loaded by
+        _restore_browser_state(); an invalid session redirects it to login.
+        """
+        current_url = (self.driver.current_url or "").lower()
+        if "login" in current_url or "signin" in current_url:
+            logging.debug("Redirected to login page, session invalid")
+            return False
+        
+        # The account area is members-only, so still being on it proves the login
+        if "/my/" in current_url:
+            logging.info("✅ Session data restored and login verified")
+            self._login_state_cache = (time.monotonic(), True)
+            return True
+        
+        # Ended up somewhere else - check the page itself
         if self.is_logged_in():
             logging.info("✅ Session data restored and login verified")
             return True
@@ -605,37 +1055,47 @@ class LoginManager:
             logging.warning("⚠️ Session data restored but login verification failed")
             return False
     
-    def clear_session(self):
+    def clear_session(self) -> bool:
         """Clear saved session data"""
+        self.wait_for_session_save()
+        self._session_cache = None
+        return LoginManager.clear_session_file(self.session_file)
+    
+    @staticmethod
+    def clear_session_file(session_file: Union[str, Path] = ".cache/session_data.json") -> bool:
+        """Delete a saved session file without needing a browser"""
+        LoginManager._drain_session_writer()
+        session_path = Path(session_file)
         try:
-            if self.session_file.exists():
-                self.session_file.unlink()
+            if session_path.exists():
+                session_path.unlink()
                 logging.info("🗑️ Cleared saved session data")
             return True
         except Exception as e:
-            logging.warning(f"⚠️ Could not clear session data: {e}")
+            logging.warning("⚠️ Could not clear session data: %s", e)
             return False
     
-    def is_session_valid(self):
-        """Check if there's a valid saved session without loading it"""
+    def is_session_valid(self) -> bool:
+        """Check if there's a valid saved session without loading it
+        
+        save_session() sets the file's mtime to the saved timestamp, so the
+        age check needs no parsing.
+        """
+        self.wait_for_session_save()
         try:
-            if not self.session_file.exists():
-                return False
-            
-            with open(self.session_file, 'rb') as f:
-                session_data = pickle.load(f)
-            
-            # Check age
-            session_age = time.time() - session_data.get('timestamp', 0)
-            max_age = SESSION_MAX_AGE_SECONDS  # 24 hours
-            
-            return session_age <= max_age
-            
-        except Exception:
+            file_stat = self.session_file.stat()
+        except OSError:
+            return False
+        
+        if not file_stat.st_size:
             return False
+        
+        session_age = time.time() - file_stat.st_mtime
+        return session_age <= SESSION_MAX_AGE_SECONDS
     
     @profile_timing("login_with_session_persistence", "authentication", "method")
-    def login_with_session_persistence(self, username=None, password=None, force_relogin=False):
+    def login_with_session_persistence(self, username: Optional[str] = None, password: Optional[str] = None,
+                                       force_relogin: bool = False) -> bool:
         """Enhanced login with session persistence - checks Chrome's native session first"""
         username = username or USERNAME
         password = password or PASSWORD
@@ -649,14 +1109,7 @@ class LoginManager:
             logging.info("🔍 Checking Chrome's native session...")
             
             # Navigate to homepage and check if already logged in via Chrome's persistent cookies
-            self.driver.get("https://www.karaoke-version.com")
-            # Wait for homepage to load for Chrome session check
-            try:
-                self.wait.until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
-            except TimeoutException:
-                pass
+            self._load_homepage()
             
             if self.is_logged_in():
                 logging.info("🎉 Already logged in via Chrome's persistent session!")
@@ -664,11 +1117,16 @@ class LoginManager:
                 # Still save session data for our tracking
                 self.save_session()
                 return True
-            else:
-                logging.info("💡 Chrome's native session not logged in")
-        else:
-            logging.info("🔄 Force relogin requested")
+            
+            logging.info("💡 Chrome's native session not logged in")
+            # The homepage is loaded and probed already - go straight to logging in
+            logging.info("🔐 Proceeding with fresh login...")
+            self._login_state_scoped = True
+            try:
+                return self._login_after_check(username, password)
+            finally:
+                self._login_state_scoped = False
         
-        # Fall back to regular login process
+        logging.info("🔄 Force relogin requested")
         logging.info("🔐 Proceeding with fresh login...")
-        return self.login(username, password, force_relogin=force_relogin)
\ No newline at end of file
+        return self.login(username, password, force_relogin=True)
\ No newline at end of file
@@ -1,13 +1,19 @@
 """Chrome browser management for karaoke automation"""
 
 import os
+import json
+import shutil
+import time
 import logging
 from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
-from ..configuration.config import WEBDRIVER_DEFAULT_TIMEOUT, DOWNLOAD_COMPLETION_TIMEOUT, DOWNLOAD_CHECK_INTERVAL
+from ..configuration.config import (
+    WEBDRIVER_DEFAULT_TIMEOUT, WEBDRIVER_POLL_FREQUENCY,
+    DOWNLOAD_COMPLETION_TIMEOUT, DOWNLOAD_CHECK_INTERVAL, DOWNLOAD_FIRST_CHECK_DELAY
+)
 from ..utils.performance_profiler import profile_timing, profile_selenium
 from webdriver_manager.chrome import ChromeDriverManager
 
@@ -17,6 +23,62 @@ except ImportError:
     # Fallback for when config is not available during testing
     DOWNLOAD_FOLDER = "./downloads"
 
+# Standard macOS install location, used when present
+_MAC_CHROME_BINARY = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
+
+# Site whose stored data reset_session() clears
+_SITE_ORIGIN = "https://www.karaoke-version.com"
+
+# Local ChromeDriver installs checked before searching PATH
+_DRIVER_CANDIDATES = (
+    "/opt/homebrew/bin/chromedriver",  # Homebrew on Apple Silicon
+    "/usr/local/bin/chromedriver",     # Homebrew on Intel
+    str(Path.home() / ".webdriver" / "chromedriver" / "chromedriver"),
+)
+
+# Where _get_chrome_service() remembers a ChromeDriver downloaded by webdriver-manager
+_DRIVER_PATH_CACHE = Path(".cache") / "chromedriver.json"
+
+# Chrome arguments, built once at import rather than on every setup_driver()
+_HEADLESS_ARGS = (
+    "--headless=new",  # New headless mode (faster, harder to detect)
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--window-size=1920,1080",
+    # Add user-agent to appear more like a real browser
+    "--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+)
+_STABILITY_ARGS = (
+    "--disable-blink-features=AutomationControlled",
+    "--disable-extensions",
+)
+# Allow reusing the same profile without conflicts
+_PROFILE_ARGS = (
+    "--disable-features=VizDisplayCompositor",
+    "--no-first-run",
+    "--no-default-browser-check",
+)
+# Startup work the automation never uses
+_BACKGROUND_ARGS = (
+    "--disable-background-networking",  # component/variations fetches at launch
+    "--disable-sync",  # no Google account, so nothing to sync into the profile
+    "--disable-default-apps",  # skip installing bundled apps into a new profile
+    # Per-page phishing classifier; Safe Browsing download checks stay on
+    "--disable-client-side-phishing-detection",
+    # Keep timers and rendering at full speed when the window is hidden or
+    # covered, so solo-activation and download waits are not stretched
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+)
+# Download preferences other than the (per-run) download directory
+_DOWNLOAD_PREFS = {
+    "download.prompt_for_download": False,
+    "download.directory_upgrade": True,
+    "safebrowsing.enabled": True
+}
+
 
 class ChromeManager:
     """Manages Chrome browser setup, configuration, and lifecycle"""
@@ -41,7 +103,9 @@ class ChromeManager:
         try:
             logging.info("⏳ Starting Chrome browser...")
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.wait = WebDriverWait(self.driver, WEBDRIVER_DEFAULT_TIMEOUT)
+            self.wait = WebDriverWait(
+                self.driver, WEBDRIVER_DEFAULT_TIMEOUT, poll_frequency=WEBDRIVER_POLL_FREQUENCY
+            )
             logging.info("✅ Chrome browser started successfully")
             
         except Exception as e:
@@ -55,53 +119,40 @@ class ChromeManager:
         
         # Configure headless mode if requested
         if self.headless:
-            # Use new headless mode (harder to detect)
-            chrome_options.add_argument("--headless=new")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=1920,1080")
-            # Add user-agent to appear more like a real browser
-            chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+            for argument in _HEADLESS_ARGS:
+                chrome_options.add_argument(argument)
             logging.info("🔇 Running in headless mode (browser hidden)")
-            logging.debug("Headless Chrome arguments: --headless=new, --no-sandbox, --disable-dev-shm-usage, --disable-gpu")
+            logging.debug("Headless Chrome arguments: --headless=new, --no-sandbox, --disable-dev-shm-usage")
         else:
             logging.info("👁️ Running in visible mode (browser window open)")
             logging.debug("Chrome will open visible window for debugging")
         
         # Add Chrome binary path for macOS if needed
-        if os.path.exists("/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"):
-            chrome_options.binary_location = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
-            logging.debug("Using Chrome binary at: /Applications/Google Chrome.app/Contents/MacOS/Google Chrome")
+        if os.path.exists(_MAC_CHROME_BINARY):
+            chrome_options.binary_location = _MAC_CHROME_BINARY
+            logging.debug(f"Using Chrome binary at: {_MAC_CHROME_BINARY}")
         
         # Additional stability options
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_argument("--disable-extensions")
+        for argument in _STABILITY_ARGS:
+            chrome_options.add_argument(argument)
+        # navigator.webdriver is already hidden by AutomationControlled above;
+        # this only drops the "controlled by automated software" banner
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
         
         # Use persistent user data directory for session persistence
         user_data_dir = os.path.abspath("chrome_profile")
         chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
-        
-        # Allow reusing the same profile without conflicts
-        chrome_options.add_argument("--disable-web-security")
-        chrome_options.add_argument("--disable-features=VizDisplayCompositor") 
-        chrome_options.add_argument("--no-first-run")
-        chrome_options.add_argument("--no-default-browser-check")
+        for argument in _PROFILE_ARGS + _BACKGROUND_ARGS:
+            chrome_options.add_argument(argument)
         
         logging.debug(f"Chrome user data directory: {user_data_dir}")
         
         # Initial download preferences (will be updated per song)
-        prefs = {
-            "download.default_directory": os.path.abspath(DOWNLOAD_FOLDER),
-            "download.prompt_for_download": False,
-            "download.directory_upgrade": True,
-            "safebrowsing.enabled": True
-        }
+        download_dir = os.path.abspath(DOWNLOAD_FOLDER)
+        prefs = {"download.default_directory": download_dir, **_DOWNLOAD_PREFS}
         chrome_options.add_experimental_option("prefs", prefs)
         
-        logging.debug(f"Chrome download directory: {os.path.abspath(DOWNLOAD_FOLDER)}")
+        logging.debug(f"Chrome download directory: {download_dir}")
         logging.debug("Chrome preferences configured for automatic downloads")
         
         return chrome_options
@@ -111,36 +162,26 @@ class ChromeManager:
         logging.info("⏳ Setting up ChromeDriver...")
         
         # Try local ChromeDriver first (faster and more reliable)
-        local_paths = [
-            "/opt/homebrew/bin/chromedriver",  # Homebrew on Apple Silicon
-            "/usr/local/bin/chromedriver",     # Homebrew on Intel
-            str(Path.home() / ".webdriver" / "chromedriver" / "chromedriver"),
-            "chromedriver"  # In PATH
-        ]
+        path = next((p for p in _DRIVER_CANDIDATES if os.path.exists(p)), None)
+        path = path or shutil.which("chromedriver")  # In PATH
         
         service = None
-        for path in local_paths:
-            if os.path.exists(path):
-                logging.info(f"✅ Using local ChromeDriver at: {path}")
-                try:
-                    # Try with a specific port to avoid binding issues
-                    service = Service(path, port=9515)
-                except Exception as e:
-                    logging.debug(f"Port 9515 failed, trying default: {e}")
-                    service = Service(path)
-                break
+        if path:
+            logging.info(f"✅ Using local ChromeDriver at: {path}")
+            service = Service(path)
         
         # Fallback to webdriver-manager if no local version found
         if not service:
-            logging.info("⏳ No local ChromeDriver found, downloading...")
             try:
-                driver_path = ChromeDriverManager().install()
-                try:
-                    service = Service(driver_path, port=9515)
-                except Exception as e:
-                    logging.debug(f"Port 9515 failed, trying default: {e}")
-                    service = Service(driver_path)
-                logging.info("✅ ChromeDriver downloaded successfully")
+                driver_path = self._cached_driver_path()
+                if driver_path:
+                    logging.info(f"✅ Using previously downloaded ChromeDriver at: {driver_path}")
+                else:
+                    logging.info("⏳ No local ChromeDriver found, downloading...")
+                    driver_path = ChromeDriverManager().install()
+                    self._remember_driver_path(driver_path)
+                    logging.info("✅ ChromeDriver downloaded successfully")
+                service = Service(driver_path)
             except Exception as e:
                 logging.error(f"❌ ChromeDriver download failed: {e}")
                 logging.error("💡 Please install ChromeDriver manually:")
@@ -151,6 +192,43 @@ class ChromeManager:
         
         return service
     
+    @staticmethod
+    def _browser_stamp():
+        """Modification time of the installed Chrome, to notice browser updates"""
+        for path in (_MAC_CHROME_BINARY, shutil.which("google-chrome")):
+            if path and os.path.exists(path):
+                return os.path.getmtime(path)
+        return None
+    
+    def _cached_driver_path(self):
+        """Return the ChromeDriver webdriver-manager installed last time, if still usable
+        
+        Skips webdriver-manager's network version check on every start; the
+        cache is ignored once Chrome itself has been updated.
+        """
+        try:
+            cached = json.loads(_DRIVER_PATH_CACHE.read_text())
+        except (OSError, ValueError):
+            return None
+        
+        driver_path = cached.get('driver_path') if isinstance(cached, dict) else None
+        if not driver_path or not os.path.exists(driver_path):
+            return None
+        if cached.get('browser_stamp') != self._browser_stamp():
+            return None
+        return driver_path
+    
+    def _remember_driver_path(self, driver_path):
+        """Record a webdriver-manager install for _cached_driver_path()"""
+        try:
+            _DRIVER_PATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            _DRIVER_PATH_CACHE.write_text(json.dumps({
+                'driver_path': driver_path,
+                'browser_stamp': self._browser_stamp()
+            }))
+        except OSError as e:
+            logging.debug(f"Could not cache ChromeDriver path: {e}")
+    
     def _log_troubleshooting_tips(self):
         """Log troubleshooting tips for Chrome setup issues"""
         logging.error("💡 Troubleshooting tips:")
@@ -174,28 +252,52 @@ class ChromeManager:
             })
             logging.debug(f"Updated download path to: {path}")
     
+    def reset_session(self, origin=_SITE_ORIGIN):
+        """Return the running browser to a clean, logged-out state
+        
+        Much cheaper than quit() plus a new setup_driver(): clears cookies and
+        the site's storage but keeps Chrome, ChromeDriver and the HTTP cache.
+        
+        Args:
+            origin (str): Site whose storage (localStorage, IndexedDB, ...) is cleared
+        """
+        if not self.driver:
+            return
+        
+        self.driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        self.driver.execute_cdp_cmd('Storage.clearDataForOrigin', {
+            'origin': origin,
+            'storageTypes': 'all'
+        })
+        self.driver.get("about:blank")
+        logging.debug(f"Browser session reset (storage cleared for {origin})")
+    
     @profile_timing("wait_for_downloads_to_complete", "browser", "method")
     def wait_for_downloads_to_complete(self, download_path, timeout=DOWNLOAD_COMPLETION_TIMEOUT):
-        """Wait for any active downloads to complete before quitting"""
+        """Wait for any active downloads to complete before quitting
+        
+        Polls quickly at first and backs off to DOWNLOAD_CHECK_INTERVAL, so a
+        download that is about to finish doesn't hold up shutdown for a full
+        interval.
+        """
         if not self.driver:
             return
-            
-        import time
-        import glob
-        from pathlib import Path
         
         logging.info("🔍 Checking for active downloads before closing browser...")
         
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        deadline = time.monotonic() + timeout
+        delay = DOWNLOAD_FIRST_CHECK_DELAY
+        last_count = None
+        while time.monotonic() < deadline:
             # Check for .crdownload files which indicate active downloads
-            download_folder = Path(download_path)
-            if download_folder.exists():
-                crdownload_files = list(download_folder.glob("**/*.crdownload"))
-                if crdownload_files:
-                    logging.info(f"⏳ Waiting for {len(crdownload_files)} active downloads to complete...")
-                    time.sleep(DOWNLOAD_CHECK_INTERVAL)
-                    continue
+            active_downloads = self._count_active_downloads(download_path)
+            if active_downloads:
+                if active_downloads != last_count:
+                    logging.info(f"⏳ Waiting for {active_downloads} active downloads to complete...")
+                    last_count = active_downloads
+                time.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+                delay = min(delay * 2, DOWNLOAD_CHECK_INTERVAL)
+                continue
             
             # No active downloads found
             logging.info("✅ No active downloads detected")
@@ -203,12 +305,38 @@ class ChromeManager:
         else:
             logging.warning(f"⚠️ Timeout waiting for downloads to complete after {timeout} seconds")
     
+    @staticmethod
+    def _count_active_downloads(download_path):
+        """Count .crdownload files in the download folder and its song folders
+        
+        Chrome writes into the folder set by set_download_path() (one per song),
+        so only one level of subfolders is scanned rather than the whole tree.
+        """
+        count = 0
+        try:
+            with os.scandir(download_path) as entries:
+                song_folders = []
+                for entry in entries:
+                    if entry.name.endswith('.crdownload'):
+                        count += 1
+                    elif entry.is_dir(follow_symlinks=False):
+                        song_folders.append(entry.path)
+        except (FileNotFoundError, NotADirectoryError):
+            return 0
+        
+        for folder in song_folders:
+            try:
+                with os.scandir(folder) as entries:
+                    count += sum(1 for entry in entries if entry.name.endswith('.crdownload'))
+            except OSError:
+                continue  # Folder removed while scanning
+        return count
+    
     def quit(self):
         """Safely quit the browser after waiting for downloads to complete"""
         if self.driver:
             try:
                 # Wait for any active downloads to complete
-                from packages.configuration import DOWNLOAD_FOLDER
                 self.wait_for_downloads_to_complete(DOWNLOAD_FOLDER)
                 
                 logging.info("🔚 Closing Chrome browser...")
@@ -33,6 +33,8 @@ WEBDRIVER_DEFAULT_TIMEOUT = 10
 WEBDRIVER_SHORT_TIMEOUT = 3
 WEBDRIVER_BRIEF_TIMEOUT = 2
 WEBDRIVER_MICRO_TIMEOUT = 0.5
+WEBDRIVER_POLL_FREQUENCY = 0.1  # seconds between explicit-wait polls (Selenium default: 0.5)
+WEBDRIVER_CONNECTION_POOL_SIZE = 10  # HTTP connections a reattached driver keeps open to chromedriver (urllib3 default: 1)
 
 # Sleep/Delay Constants
 PROGRESS_UPDATE_INTERVAL = 0.5
@@ -51,12 +53,15 @@ DOWNLOAD_COMPLETION_TIMEOUT = 60
 
 # Polling Intervals
 DOWNLOAD_CHECK_INTERVAL = 3  # Reduced from 5s - faster polling for quicker completion detection
+DOWNLOAD_FIRST_CHECK_DELAY = 0.1  # first re-check of active downloads; doubles up to DOWNLOAD_CHECK_INTERVAL
 FILE_CHECK_INTERVAL = 1
 SOLO_CHECK_INTERVAL = 0.5
 DOWNLOAD_MONITORING_INITIAL_WAIT = 10  # Performance optimization: reduced from 15s - test server generation reliability
 
 # Session Constants
 SESSION_MAX_AGE_SECONDS = 24 * 60 * 60  # 24 hours
+HTTP_LOGIN_ENABLED = False  # experimental direct-POST login; falls back to the login form when off
+DIRECT_LOGOUT_ENABLED = False  # load /my/logout.html before trying the page's logout link
 
 # UI Constants
 PROGRESS_BAR_WIDTH = 20
@@ -6,11 +6,30 @@ Separated from config.py to keep config file clean
 """
 
 import os
+import re
 import yaml
 import logging
 from ..utils.performance_profiler import profile_timing
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+
+# Contractions as they appear in URL slugs ("don-t") and their restored form:
+# don't, I'm, we're, it's, I'll, I've, I'd. Conservative on purpose; only
+# these endings are treated as contractions.
+_CONTRACTION_RE = re.compile(r'\b(\w+)-(t|m|re|s|ll|ve|d)\b', re.IGNORECASE)
+
+# Splits a song URL after its last "custombackingtrack/" into the artist path
+# (everything up to the last slash, if any) and the song slug without ".html"
+_SONG_URL_RE = re.compile(
+    r'.*custombackingtrack/(?:(?P<artist>.*)/)?(?P<song>.*?)(?:\.html)?\Z', re.DOTALL
+)
+
+# Characters not allowed in folder names (apostrophes are kept)
+_INVALID_NAME_CHARS = frozenset('<>:"/\\|?*')
+_INVALID_NAME_TRANSLATION = str.maketrans(dict.fromkeys(_INVALID_NAME_CHARS, '_'))
+
+# libyaml's C parser when PyYAML was built with it, otherwise the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 class ConfigurationManager:
     """Manages application configuration with validation and defaults"""
@@ -18,18 +37,38 @@ class ConfigurationManager:
     def __init__(self, songs_config_file: str = "songs.yaml"):
         self.songs_config_file = songs_config_file
         self.logger = logging.getLogger(__name__)
+        # ((path, st_mtime_ns, st_size), validated songs) of the last successful load
+        self._songs_cache: Optional[Tuple[Tuple[str, int, int], List[Dict[str, Any]]]] = None
+    
+    @property
+    def _config_path(self) -> Path:
+        """Path of the songs config file"""
+        return Path(self.songs_config_file)
+    
+    def invalidate_cache(self):
+        """Force the next load_songs_config() to re-read the file"""
+        self._songs_cache = None
     
     @profile_timing("load_songs_config", "configuration", "method")
     def load_songs_config(self) -> List[Dict[str, Any]]:
-        """Load and validate songs configuration from YAML file"""
+        """Load and validate songs configuration from YAML file
+        
+        The validated songs are cached until the file's path, mtime or size changes.
+        """
         try:
-            config_path = Path(self.songs_config_file)
-            if not config_path.exists():
+            config_path = self._config_path
+            try:
+                stat = config_path.stat()
+            except FileNotFoundError:
                 self.logger.error(f"Songs config file '{self.songs_config_file}' not found. Please create it.")
                 return []
 
-            with open(config_path, 'r') as file:
-                config = yaml.safe_load(file)
+            file_key = (str(config_path), stat.st_mtime_ns, stat.st_size)
+            if self._songs_cache and self._songs_cache[0] == file_key:
+                return [dict(song) for song in self._songs_cache[1]]
+
+            with open(config_path, 'rb') as file:
+                config = yaml.load(file, Loader=_YAML_LOADER)
                 songs = config.get('songs', [])
 
                 if not songs:
@@ -47,6 +86,7 @@ class ConfigurationManager:
                         validated_songs.append(validated_song)
 
                 self.logger.info(f"Loaded {len(validated_songs)} valid songs from configuration")
+                self._songs_cache = (file_key, [dict(song) for song in validated_songs])
                 return validated_songs
 
         except yaml.YAMLError as e:
@@ -61,10 +101,9 @@ class ConfigurationManager:
 
         Returns a set of URLs that have conflicting song names and need artist prefix
         """
-        from collections import defaultdict
-
-        # Map song names to URLs that use them
-        song_name_to_urls = defaultdict(list)
+        first_url_by_name = {}
+        duplicate_counts: Dict[str, int] = {}
+        conflicting_urls = set()
 
         for song in songs:
             if 'url' not in song:
@@ -72,16 +111,20 @@ class ConfigurationManager:
 
             # Extract just the song name portion
             song_only_name = self._extract_song_name_only(song['url'])
-            if song_only_name and song_only_name != "Unknown Song":
-                song_name_to_urls[song_only_name].append(song['url'])
+            if not song_only_name or song_only_name == "Unknown Song":
+                continue
 
-        # Find URLs with conflicting song names
-        conflicting_urls = set()
-        for song_name, urls in song_name_to_urls.items():
-            if len(urls) > 1:
-                # Multiple songs with same name - mark all for artist prefix
-                conflicting_urls.update(urls)
-                self.logger.info(f"Detected {len(urls)} songs named '{song_name}' - will use 'Artist - Song' format")
+            if song_only_name not in first_url_by_name:
+                first_url_by_name[song_only_name] = song['url']
+                continue
+
+            # Multiple songs with same name - mark all for artist prefix
+            conflicting_urls.add(first_url_by_name[song_only_name])
+            conflicting_urls.add(song['url'])
+            duplicate_counts[song_only_name] = duplicate_counts.get(song_only_name, 1) + 1
+
+        for song_name, count in duplicate_counts.items():
+            self.logger.info(f"Detected {count} songs named '{song_name}' - will use 'Artist - Song' format")
 
         return conflicting_urls
 
@@ -139,17 +182,8 @@ class ConfigurationManager:
     def _extract_song_name_only(self, url: str) -> str:
         """Extract just the song name portion from URL (without artist)"""
         try:
-            if 'custombackingtrack/' in url:
-                path_part = url.split('custombackingtrack/')[-1]
-                if path_part.endswith('.html'):
-                    path_part = path_part[:-5]
-
-                # Extract only song name (after the last slash)
-                if '/' in path_part:
-                    path_part = path_part.split('/')[-1]
-
-                return path_part
-            return "Unknown Song"
+            match = _SONG_URL_RE.match(url)
+            return match.group('song') if match else "Unknown Song"
         except Exception:
             return "Unknown Song"
 
@@ -161,37 +195,27 @@ class ConfigurationManager:
             include_artist: If True, include artist name to avoid conflicts
         """
         try:
-            # Extract the path part after custombackingtrack
             # Example: https://www.karaoke-version.com/custombackingtrack/artist/song.html
-            if 'custombackingtrack/' in url:
-                path_part = url.split('custombackingtrack/')[-1]
-                # Remove .html extension if present
-                if path_part.endswith('.html'):
-                    path_part = path_part[:-5]
+            match = _SONG_URL_RE.match(url)
+            if match:
+                artist_part, song_part = match.group('artist', 'song')
 
                 # Decide whether to include artist based on conflicts
-                if include_artist and '/' in path_part:
+                if include_artist and artist_part is not None:
                     # Keep "artist/song" format for conflicts
-                    artist_part, song_part = path_part.rsplit('/', 1)
                     artist_part = self._restore_apostrophes(artist_part)
                     song_part = self._restore_apostrophes(song_part)
                     artist_name = artist_part.replace('-', ' ').title()
                     song_name = song_part.replace('-', ' ').title()
                     name = f"{artist_name} - {song_name}"
                 else:
-                    # Extract only the song name (after the last slash)
-                    # For URL like "artist/song", we want just "song"
-                    if '/' in path_part:
-                        path_part = path_part.split('/')[-1]
-
-                    path_part = self._restore_apostrophes(path_part)
+                    # Only the song name: for "artist/song", just "song"
+                    song_part = self._restore_apostrophes(song_part)
                     # Replace remaining hyphens with spaces and title case
-                    name = path_part.replace('-', ' ').title()
+                    name = song_part.replace('-', ' ').title()
 
                 # Clean up invalid characters but preserve apostrophes
-                invalid_chars = '<>:"/\\|?*'  # Removed apostrophe from invalid chars
-                for char in invalid_chars:
-                    name = name.replace(char, '_')
+                name = name.translate(_INVALID_NAME_TRANSLATION)
 
                 # Limit length
                 if len(name) > 100:
@@ -207,33 +231,7 @@ class ConfigurationManager:
 
     def _restore_apostrophes(self, text: str) -> str:
         """Restore apostrophes in common English contractions from URL patterns"""
-        import re
-
-        # Handle specific contraction patterns that are commonly found in URLs
-        # These patterns are more conservative and target actual contractions
-
-        # Pattern 1: Common contractions ending in 't (don't, can't, won't, etc.)
-        text = re.sub(r'\b(\w+)-t\b', r"\1't", text, flags=re.IGNORECASE)
-
-        # Pattern 2: Common contractions ending in 'm (I'm, etc.)
-        text = re.sub(r'\b(\w+)-m\b', r"\1'm", text, flags=re.IGNORECASE)
-
-        # Pattern 3: Common contractions ending in 're (we're, you're, they're)
-        text = re.sub(r'\b(\w+)-re\b', r"\1're", text, flags=re.IGNORECASE)
-
-        # Pattern 4: Common contractions ending in 's (it's, that's, etc.)
-        text = re.sub(r'\b(\w+)-s\b', r"\1's", text, flags=re.IGNORECASE)
-
-        # Pattern 5: Common contractions ending in 'll (I'll, we'll, etc.)
-        text = re.sub(r'\b(\w+)-ll\b', r"\1'll", text, flags=re.IGNORECASE)
-
-        # Pattern 6: Common contractions ending in 've (I've, we've, etc.)
-        text = re.sub(r'\b(\w+)-ve\b', r"\1've", text, flags=re.IGNORECASE)
-
-        # Pattern 7: Common contractions ending in 'd (I'd, we'd, etc.)
-        text = re.sub(r'\b(\w+)-d\b', r"\1'd", text, flags=re.IGNORECASE)
-
-        return text
+        return _CONTRACTION_RE.sub(r"\1'\2", text)
     
     def _validate_key_value(self, key_value: Any, song_name: str) -> int:
         """Validate and normalize key adjustment value
@@ -289,8 +287,10 @@ class ConfigurationManager:
         if not url:
             return False
         
+        lowered = url.lower()
+        
         # Check for karaoke-version.com URLs
-        if 'karaoke-version.com' not in url.lower():
+        if 'karaoke-version.com' not in lowered:
             return False
         
         # Check for HTTPS
@@ -298,7 +298,7 @@ class ConfigurationManager:
             return False
         
         # Check for custombackingtrack path
-        if 'custombackingtrack' not in url.lower():
+        if 'custombackingtrack' not in lowered:
             return False
         
         return True
@@ -309,10 +309,8 @@ class ConfigurationManager:
             return False
         
         # Check for invalid filesystem characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            if char in name:
-                return False
+        if not _INVALID_NAME_CHARS.isdisjoint(name):
+            return False
         
         # Check length
         if len(name) > 100:
@@ -323,7 +321,7 @@ class ConfigurationManager:
     def validate_configuration_file(self) -> bool:
         """Validate the configuration file exists and is readable"""
         try:
-            config_path = Path(self.songs_config_file)
+            config_path = self._config_path
             
             if not config_path.exists():
                 self.logger.error(f"Configuration file {self.songs_config_file} does not exist")
@@ -334,8 +332,8 @@ class ConfigurationManager:
                 return False
             
             # Try to read and parse
-            with open(config_path, 'r') as file:
-                yaml.safe_load(file)
+            with open(config_path, 'rb') as file:
+                yaml.load(file, Loader=_YAML_LOADER)
             
             self.logger.debug(f"Configuration file {self.songs_config_file} is valid")
             return True
@@ -353,7 +351,7 @@ class ConfigurationManager:
         
         summary = {
             'config_file': self.songs_config_file,
-            'config_exists': Path(self.songs_config_file).exists(),
+            'config_exists': self._config_path.exists(),
             'total_songs': len(songs),
             'songs_with_key_adjustment': len([s for s in songs if s['key'] != 0]),
             'key_adjustments': {s['name']: s['key'] for s in songs if s['key'] != 0}
@@ -8,19 +8,21 @@ regressions in the critical authentication system.
 """
 
 import sys
-import pickle
+import json
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch, call, MagicMock
+from unittest.mock import ANY, Mock, patch
 from unittest import TestCase
 
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from selenium.webdriver.support.ui import WebDriverWait
+
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from packages.authentication.login_manager import LoginManager
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from packages.authentication.login_manager import LoginManager, _AttachedRemote
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
 
 
 class TestLoginManagerInitialization(TestCase):
@@ -37,26 +39,43 @@ class TestLoginManagerInitialization(TestCase):
         
         self.assertEqual(manager.driver, self.mock_driver)
         self.assertEqual(manager.wait, self.mock_wait)
-        self.assertEqual(str(manager.session_file), ".cache/session_data.pkl")
+        self.assertEqual(str(manager.session_file), ".cache/session_data.json")
     
     def test_initialization_with_custom_session_file(self):
         """Test LoginManager initializes with custom session file path"""
         with tempfile.TemporaryDirectory() as temp_dir:
-            custom_path = f"{temp_dir}/session.pkl"
+            custom_path = f"{temp_dir}/session.json"
             manager = LoginManager(self.mock_driver, self.mock_wait, custom_path)
             
             self.assertEqual(str(manager.session_file), custom_path)
     
+    def test_initialization_builds_wait_when_missing(self):
+        """Test a fast-polling WebDriverWait is created when none is passed"""
+        manager = LoginManager(self.mock_driver, None)
+        
+        self.assertIs(manager.wait._driver, self.mock_driver)
+        self.assertEqual(manager.wait._poll, 0.1)
+    
     @patch('pathlib.Path.mkdir')
-    def test_initialization_creates_session_directory(self, mock_mkdir):
-        """Test LoginManager creates session directory on initialization"""
+    def test_initialization_defers_session_directory(self, mock_mkdir):
+        """Test LoginManager doesn't touch the filesystem until a session is saved"""
         with tempfile.TemporaryDirectory() as temp_dir:
-            session_file = f"{temp_dir}/cache/session.pkl"
+            session_file = f"{temp_dir}/cache/session.json"
             LoginManager(self.mock_driver, self.mock_wait, session_file)
             
-            # Verify directory creation was attempted
-            mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
-
+            mock_mkdir.assert_not_called()
+    
+    def test_save_session_creates_session_directory(self):
+        """Test the session directory is created on the first save"""
+        self.mock_driver.get_cookies.return_value = []
+        self.mock_driver.execute_script.return_value = {}
+        with tempfile.TemporaryDirectory() as temp_dir:
+            session_file = Path(temp_dir) / "cache" / "session.json"
+            manager = LoginManager(self.mock_driver, self.mock_wait, str(session_file))
+            
+            self.assertTrue(manager.save_session())
+            self.assertTrue(manager.wait_for_session_save())
+            self.assertTrue(session_file.exists())
 
 class TestLoginStatusChecking(TestCase):
     """Test login status detection methods"""
@@ -68,45 +87,27 @@ class TestLoginStatusChecking(TestCase):
         self.manager = LoginManager(self.mock_driver, self.mock_wait)
     
     def test_is_logged_in_finds_my_account(self):
-        """Test login detection via 'My Account' element"""
-        # Mock finding 'My Account' element
-        mock_element = Mock()
-        self.mock_driver.find_elements.return_value = [mock_element]
+        """Test login detection via 'My Account' link"""
+        self.mock_driver.execute_script.return_value = {'loggedIn': True, 'hasMyAccount': True, 'hasLoginLink': False}
         
         result = self.manager.is_logged_in()
         
         self.assertTrue(result)
-        self.mock_driver.find_elements.assert_called_with(
-            By.XPATH, "//*[contains(text(), 'My Account')]"
-        )
+        # Both indicators are resolved in a single in-page probe
+        self.mock_driver.execute_script.assert_called_once()
+        self.mock_driver.find_elements.assert_not_called()
     
     def test_is_logged_in_no_login_links_fallback(self):
         """Test login detection via absence of login links"""
-        # Mock no 'My Account' but also no login links
-        self.mock_driver.find_elements.side_effect = [
-            [],  # No 'My Account' elements
-            []   # No login links
-        ]
+        self.mock_driver.execute_script.return_value = {'loggedIn': True, 'hasMyAccount': False, 'hasLoginLink': False}
         
         result = self.manager.is_logged_in()
         
         self.assertTrue(result)
-        
-        # Verify both checks were made
-        expected_calls = [
-            call(By.XPATH, "//*[contains(text(), 'My Account')]"),
-            call(By.XPATH, "//a[contains(text(), 'Log in')]")
-        ]
-        self.mock_driver.find_elements.assert_has_calls(expected_calls)
     
     def test_is_logged_in_login_links_present(self):
         """Test login detection when login links are present (not logged in)"""
-        # Mock no 'My Account' but login links present
-        mock_login_link = Mock()
-        self.mock_driver.find_elements.side_effect = [
-            [],  # No 'My Account' elements
-            [mock_login_link]  # Login links present
-        ]
+        self.mock_driver.execute_script.return_value = {'loggedIn': False, 'hasMyAccount': False, 'hasLoginLink': True}
         
         result = self.manager.is_logged_in()
         
@@ -116,12 +117,40 @@ class TestLoginStatusChecking(TestCase):
     def test_is_logged_in_logging_behavior(self, mock_log):
         """Test is_logged_in logs appropriate messages"""
         # Test logged in scenario
-        mock_element = Mock()
-        self.mock_driver.find_elements.return_value = [mock_element]
+        self.mock_driver.execute_script.return_value = {'loggedIn': True, 'hasMyAccount': True, 'hasLoginLink': False}
         
         self.manager.is_logged_in()
         
         mock_log.assert_called_with("✅ User is logged in: Found 'My Account' in header")
+    
+    def test_is_logged_in_memoized_within_login_scope(self):
+        """Test repeated checks during login() reuse the first DOM probe"""
+        self.mock_driver.execute_script.return_value = {'loggedIn': True, 'hasMyAccount': True, 'hasLoginLink': False}
+        self.manager._login_state_scoped = True
+        
+        self.assertTrue(self.manager.is_logged_in())
+        self.assertTrue(self.manager.is_logged_in())
+        self.assertEqual(self.mock_driver.execute_script.call_count, 1)
+        
+        # A navigation or click invalidates the memoized state
+        self.manager._invalidate_login_state()
+        self.manager.is_logged_in()
+        self.assertEqual(self.mock_driver.execute_script.call_count, 2)
+    
+    @patch('packages.authentication.login_manager.time.monotonic')
+    def test_is_logged_in_memoized_briefly_outside_login(self, mock_monotonic):
+        """Test standalone checks reuse a probe only within the short TTL"""
+        self.mock_driver.execute_script.return_value = {'loggedIn': True, 'hasMyAccount': True, 'hasLoginLink': False}
+        
+        mock_monotonic.return_value = 100.0
+        self.manager.is_logged_in()
+        mock_monotonic.return_value = 100.5
+        self.manager.is_logged_in()
+        self.assertEqual(self.mock_driver.execute_script.call_count, 1)
+        
+        mock_monotonic.return_value = 101.5
+        self.manager.is_logged_in()
+        self.assertEqual(self.mock_driver.execute_script.call_count, 2)
 
 
 class TestLogoutFunctionality(TestCase):
@@ -133,6 +162,7 @@ class TestLogoutFunctionality(TestCase):
         self.mock_wait = Mock()
         self.manager = LoginManager(self.mock_driver, self.mock_wait)
     
+    @patch('packages.authentication.login_manager.DIRECT_LOGOUT_ENABLED', True)
     @patch.object(LoginManager, '_attempt_direct_logout')
     @patch.object(LoginManager, '_fallback_cookie_logout')
     def test_logout_direct_success(self, mock_cookie_logout, mock_direct_logout):
@@ -145,55 +175,72 @@ class TestLogoutFunctionality(TestCase):
         mock_direct_logout.assert_called_once()
         mock_cookie_logout.assert_not_called()
     
+    @patch('packages.authentication.login_manager.DIRECT_LOGOUT_ENABLED', True)
     @patch.object(LoginManager, '_attempt_direct_logout')
+    @patch.object(LoginManager, '_attempt_logout_link')
     @patch.object(LoginManager, '_fallback_cookie_logout')
-    def test_logout_fallback_to_cookies(self, mock_cookie_logout, mock_direct_logout):
+    def test_logout_fallback_to_cookies(self, mock_cookie_logout, mock_link_logout, mock_direct_logout):
         """Test logout falls back to cookie logout when direct fails"""
         mock_direct_logout.return_value = False
+        mock_link_logout.return_value = False
         mock_cookie_logout.return_value = True
         
         result = self.manager.logout()
         
         self.assertTrue(result)
         mock_direct_logout.assert_called_once()
+        mock_link_logout.assert_called_once()
         mock_cookie_logout.assert_called_once()
     
-    def test_attempt_direct_logout_finds_logout_link(self):
-        """Test direct logout finds and clicks logout link"""
-        mock_element = Mock()
-        mock_element.is_displayed.return_value = True
-        mock_element.text = "Log out"
+    @patch.object(LoginManager, '_attempt_direct_logout', return_value=False)
+    @patch.object(LoginManager, '_fallback_cookie_logout')
+    def test_logout_link_used_when_logout_url_fails(self, mock_cookie_logout, mock_direct_logout):
+        """Test a logout link on the page is tried before clearing cookies"""
+        mock_link = Mock()
+        self.mock_driver.execute_script.return_value = mock_link
         
-        self.mock_driver.find_element.return_value = mock_element
+        with patch.object(self.manager, '_verify_logout_success', return_value=True):
+            result = self.manager.logout()
         
-        with patch.object(self.manager, '_direct_logout_click', return_value=True):
-            result = self.manager._attempt_direct_logout()
-            
-            self.assertTrue(result)
+        self.assertTrue(result)
+        mock_link.click.assert_called_once()
+        mock_cookie_logout.assert_not_called()
     
-    def test_attempt_direct_logout_handles_my_account_menu(self):
-        """Test direct logout handles 'My Account' menu navigation"""
-        mock_element = Mock()
-        mock_element.is_displayed.return_value = True
-        mock_element.text = "My Account"
-        
-        self.mock_driver.find_element.return_value = mock_element
+    @patch.object(LoginManager, '_attempt_direct_logout')
+    @patch.object(LoginManager, '_attempt_logout_link', return_value=True)
+    def test_logout_skips_logout_url_by_default(self, mock_link_logout, mock_direct_logout):
+        """Test the unconfirmed logout URL is not tried unless enabled in config"""
+        self.assertTrue(self.manager.logout())
         
-        with patch.object(self.manager, '_logout_via_account_menu', return_value=True) as mock_account_menu:
+        mock_direct_logout.assert_not_called()
+        mock_link_logout.assert_called_once()
+    
+    def test_attempt_direct_logout_loads_logout_url(self):
+        """Test direct logout navigates straight to the logout page"""
+        with patch.object(self.manager, '_verify_logout_success', return_value=True) as mock_verify:
             result = self.manager._attempt_direct_logout()
-            
-            self.assertTrue(result)
-            mock_account_menu.assert_called_once_with(mock_element)
+        
+        self.assertTrue(result)
+        self.mock_driver.get.assert_called_once_with("https://www.karaoke-version.com/my/logout.html")
+        mock_verify.assert_called_once()
+        self.mock_driver.find_element.assert_not_called()
     
-    def test_attempt_direct_logout_no_elements_found(self):
-        """Test direct logout when no logout elements are found"""
-        self.mock_driver.find_element.side_effect = NoSuchElementException("Not found")
+    def test_verify_logout_success_checks_login_link(self):
+        """Test logout verification waits on the page-state probe"""
+        self.mock_driver.execute_script.return_value = {
+            'loggedIn': False, 'hasMyAccount': False, 'hasLoginLink': True
+        }
+        self.mock_wait.until.side_effect = lambda condition: condition(self.mock_driver)
         
-        result = self.manager._attempt_direct_logout()
+        self.assertTrue(self.manager._verify_logout_success())
+        self.mock_driver.execute_script.assert_called_once()
+        self.mock_driver.find_element.assert_not_called()
+    
+    def test_verify_logout_success_timeout(self):
+        """Test logout is reported as failed when the login link never appears"""
+        self.mock_wait.until.side_effect = TimeoutException("Timeout")
         
-        # Should return None (falsy) when no elements found
-        self.assertIsNone(result)
-
+        self.assertFalse(self.manager._verify_logout_success())
 
 class TestFormFieldDiscovery(TestCase):
     """Test form field discovery and filling logic"""
@@ -207,41 +254,61 @@ class TestFormFieldDiscovery(TestCase):
     def test_find_username_field_by_name(self):
         """Test finding username field by name attribute"""
         mock_field = Mock()
-        self.mock_wait.until.return_value = mock_field
+        self.mock_driver.execute_script.return_value = mock_field
+        
+        result = self.manager._find_username_field()
+        
+        self.assertEqual(result, mock_field)
+        candidates = self.mock_driver.execute_script.call_args[0][1]
+        self.assertEqual(candidates[0], ("[name='frm_login']", None))
+        self.mock_wait.until.assert_not_called()
+    
+    def test_find_username_field_waits_for_late_form(self):
+        """Test username lookup falls back to waiting when the form is not rendered yet"""
+        mock_field = Mock()
+        self.mock_driver.execute_script.side_effect = [None, mock_field]
         
         result = self.manager._find_username_field()
         
         self.assertEqual(result, mock_field)
+        # All candidates share one bounded wait rather than one timeout each
+        self.mock_wait.until.assert_called_once()
+    
+    def test_find_username_field_wait_timeout(self):
+        """Test username lookup gives up after a single wait timeout"""
+        self.mock_driver.execute_script.return_value = None
+        self.mock_wait.until.side_effect = TimeoutException("Timed out")
+        
+        result = self.manager._find_username_field()
+        
+        self.assertIsNone(result)
         self.mock_wait.until.assert_called_once()
     
     def test_find_password_field_by_name(self):
         """Test finding password field by name attribute"""
         mock_field = Mock()
-        self.mock_wait.until.return_value = mock_field
+        self.mock_driver.execute_script.return_value = mock_field
         
         result = self.manager._find_password_field()
         
         self.assertEqual(result, mock_field)
-        self.mock_wait.until.assert_called_once()
+        self.mock_driver.execute_script.assert_called_once()
     
     def test_find_submit_button_multiple_selectors(self):
-        """Test finding submit button tries multiple selectors"""
+        """Test finding submit button tries multiple selectors in one lookup"""
         mock_button = Mock()
-        
-        # Mock first selector fails, second succeeds
-        self.mock_driver.find_element.side_effect = [
-            NoSuchElementException("First not found"),
-            mock_button
-        ]
+        self.mock_driver.execute_script.return_value = mock_button
         
         result = self.manager._find_submit_button()
         
         self.assertEqual(result, mock_button)
-        self.assertEqual(self.mock_driver.find_element.call_count, 2)
+        self.mock_driver.execute_script.assert_called_once()
+        candidates = self.mock_driver.execute_script.call_args[0][1]
+        self.assertEqual(len(candidates), 3)
     
     def test_find_submit_button_no_button_found(self):
         """Test submit button search when no button exists"""
-        self.mock_driver.find_element.side_effect = NoSuchElementException("Not found")
+        self.mock_driver.execute_script.return_value = None
         
         result = self.manager._find_submit_button()
         
@@ -257,11 +324,62 @@ class TestFormFieldDiscovery(TestCase):
             mock_password_field, "test_pass"
         )
         
-        # Verify fields are cleared and filled
-        mock_username_field.clear.assert_called_once()
-        mock_username_field.send_keys.assert_called_once_with("test_user")
-        mock_password_field.clear.assert_called_once()
-        mock_password_field.send_keys.assert_called_once_with("test_pass")
+        # Verify both fields are filled by a single script call
+        self.mock_driver.execute_script.assert_called_once()
+        args = self.mock_driver.execute_script.call_args[0]
+        self.assertEqual(
+            args[1:],
+            (mock_username_field, mock_password_field, "test_user", "test_pass")
+        )
+        mock_username_field.send_keys.assert_not_called()
+        mock_password_field.send_keys.assert_not_called()
+
+    
+    def test_submit_form_waits_on_page_state(self):
+        """Test login processing is detected from a single page-state probe"""
+        mock_button = Mock()
+        self.mock_driver.execute_script.return_value = {
+            'loggedIn': True, 'hasMyAccount': True, 'hasLoginLink': False,
+            'url': "https://www.karaoke-version.com/"
+        }
+        self.mock_wait.until.side_effect = lambda condition: condition(self.mock_driver)
+        
+        result = self.manager._submit_form(mock_button)
+        
+        self.assertTrue(result)
+        mock_button.click.assert_called_once()
+        self.mock_driver.execute_script.assert_called_once()
+        self.mock_driver.find_elements.assert_not_called()
+        
+        # The follow-up login check reuses the final page state
+        self.manager._login_state_scoped = True
+        self.assertTrue(self.manager.is_logged_in())
+        self.mock_driver.execute_script.assert_called_once()
+    
+    def test_submit_form_waits_for_page_transition(self):
+        """Test the login page's own 'Log in' link doesn't end the wait early"""
+        mock_button = Mock()
+        self.mock_driver.execute_script.return_value = {
+            'loggedIn': False, 'hasMyAccount': False, 'hasLoginLink': True,
+            'url': "https://www.karaoke-version.com/login"
+        }
+        conditions = []
+        self.mock_wait.until.side_effect = lambda condition: conditions.append(condition) or {}
+        
+        self.manager._submit_form(mock_button)
+        
+        # Old page still attached: not processed yet
+        self.assertFalse(conditions[0](self.mock_driver))
+        self.mock_driver.execute_script.assert_called_once_with(ANY, mock_button)
+        mock_button.is_enabled.assert_not_called()
+        
+        # Old page replaced: processed
+        self.mock_driver.execute_script.side_effect = [
+            StaleElementReferenceException("stale"),
+            {'loggedIn': False, 'hasMyAccount': False, 'hasLoginLink': True,
+             'url': "https://www.karaoke-version.com/login"}
+        ]
+        self.assertTrue(conditions[0](self.mock_driver))
 
 
 class TestLoginFlow(TestCase):
@@ -270,8 +388,17 @@ class TestLoginFlow(TestCase):
     def setUp(self):
         """Set up LoginManager with mock dependencies"""
         self.mock_driver = Mock()
+        self.mock_driver.current_url = "about:blank"
+        self.mock_driver.get_cookies.return_value = []
         self.mock_wait = Mock()
         self.manager = LoginManager(self.mock_driver, self.mock_wait)
+        # Keep the form-based flow under test; HTTP login is covered separately
+        http_login = patch.object(LoginManager, '_login_via_http', return_value=False)
+        self.mock_http_login = http_login.start()
+        self.addCleanup(http_login.stop)
+        homepage_visit = patch.object(LoginManager, '_homepage_visits', {})
+        homepage_visit.start()
+        self.addCleanup(homepage_visit.stop)
     
     @patch.object(LoginManager, 'is_logged_in')
     @patch.object(LoginManager, 'load_session')
@@ -305,6 +432,22 @@ class TestLoginFlow(TestCase):
             mock_click_link.assert_called_once()
             mock_fill_form.assert_called_once_with("user", "pass")
     
+    @patch.object(LoginManager, 'is_logged_in')
+    @patch.object(LoginManager, 'is_session_valid')
+    @patch.object(LoginManager, 'load_session')
+    @patch.object(LoginManager, 'click_login_link')
+    def test_login_restores_saved_session(self, mock_click_link, mock_load, mock_valid, mock_is_logged_in):
+        """Test login reuses a valid saved session instead of the login form"""
+        mock_is_logged_in.return_value = False
+        mock_valid.return_value = True
+        mock_load.return_value = True
+        
+        result = self.manager.login("user", "pass")
+        
+        self.assertTrue(result)
+        mock_load.assert_called_once()
+        mock_click_link.assert_not_called()
+    
     @patch.object(LoginManager, 'is_logged_in')
     @patch.object(LoginManager, 'load_session')
     @patch.object(LoginManager, 'click_login_link')
@@ -327,10 +470,244 @@ class TestLoginFlow(TestCase):
         with patch.object(self.manager, 'click_login_link', return_value=True):
             with patch.object(self.manager, 'fill_login_form', return_value=True):
                 with patch.object(self.manager, 'save_session'):
-                    result = self.manager.login("user", "pass", force_relogin=True)
+                    with patch.object(self.manager, 'logout', return_value=True) as mock_logout:
+                        result = self.manager.login("user", "pass", force_relogin=True)
                     
                     self.assertTrue(result)
                     mock_load.assert_not_called()  # Should not load session when forcing relogin
+                    mock_logout.assert_called_once()
+                    # Initial state probe plus the post-login verification only
+                    self.assertEqual(mock_is_logged_in.call_count, 2)
+    
+    @patch.object(LoginManager, 'is_logged_in')
+    def test_login_loads_homepage_despite_site_cookies(self, mock_is_logged_in):
+        """Test anonymous site cookies (analytics, consent) don't skip the homepage load"""
+        mock_is_logged_in.return_value = True
+        self.mock_driver.current_url = "https://www.karaoke-version.com/custombackingtrack/a/b.html"
+        self.mock_driver.get_cookies.return_value = [
+            {"name": "consent", "value": "1", "domain": ".karaoke-version.com"}
+        ]
+        
+        result = self.manager.login("user", "pass")
+        
+        self.assertTrue(result)
+        self.mock_driver.get.assert_called_once_with("https://www.karaoke-version.com")
+    
+    @patch.object(LoginManager, 'is_logged_in')
+    def test_login_reuses_recent_homepage_visit(self, mock_is_logged_in):
+        """Test a second login() right after a homepage load skips reloading it"""
+        mock_is_logged_in.return_value = True
+        
+        self.manager.login("user", "pass")
+        self.mock_driver.current_url = "https://www.karaoke-version.com/"
+        LoginManager(self.mock_driver, self.mock_wait).login("user", "pass")
+        
+        self.mock_driver.get.assert_called_once_with("https://www.karaoke-version.com")
+    
+    @patch.object(LoginManager, 'is_logged_in')
+    def test_login_ignores_homepage_visit_by_other_driver(self, mock_is_logged_in):
+        """Test a homepage load in one browser does not stand in for another browser's"""
+        mock_is_logged_in.return_value = True
+        self.manager.login("user", "pass")
+        
+        other_driver = Mock()
+        other_driver.current_url = "https://www.karaoke-version.com/"
+        other_driver.get_cookies.return_value = []
+        LoginManager(other_driver, Mock()).login("user", "pass")
+        
+        other_driver.get.assert_called_once_with("https://www.karaoke-version.com")
+    
+    @patch.object(LoginManager, 'is_logged_in')
+    def test_login_reloads_homepage_after_leaving_it(self, mock_is_logged_in):
+        """Test a recent homepage load is not reused once the driver moved to another page"""
+        mock_is_logged_in.return_value = True
+        
+        self.manager.login("user", "pass")
+        self.mock_driver.current_url = "https://www.karaoke-version.com/custombackingtrack/a/b.html"
+        self.manager.login("user", "pass")
+        
+        self.assertEqual(self.mock_driver.get.call_count, 2)
+    
+    @patch.object(LoginManager, 'is_logged_in')
+    def test_login_reloads_homepage_after_cookie_logout(self, mock_is_logged_in):
+        """Test login navigates home when a cookie-only logout left the page stale"""
+        mock_is_logged_in.return_value = True
+        self.mock_driver.current_url = "https://www.karaoke-version.com/my/index.html"
+        self.mock_driver.get_cookies.return_value = [
+            {"name": "session_id", "value": "abc123", "domain": ".karaoke-version.com"}
+        ]
+        self.manager._fallback_cookie_logout()
+        
+        self.manager.login("user", "pass")
+        
+        self.mock_driver.get.assert_called_once_with("https://www.karaoke-version.com")
+        self.assertFalse(self.manager._needs_reload)
+    
+    @patch('packages.authentication.login_manager.HTTP_LOGIN_ENABLED', True)
+    @patch.object(LoginManager, 'is_logged_in')
+    @patch.object(LoginManager, 'load_session')
+    @patch.object(LoginManager, 'click_login_link')
+    def test_login_via_http_skips_form(self, mock_click_link, mock_load, mock_is_logged_in):
+        """Test a successful HTTP login bypasses the login form"""
+        mock_is_logged_in.return_value = False
+        mock_load.return_value = False
+        self.mock_http_login.return_value = True
+        
+        with patch.object(self.manager, 'save_session') as mock_save:
+            result = self.manager.login("user", "pass")
+        
+        self.assertTrue(result)
+        self.mock_http_login.assert_called_once_with("user", "pass")
+        mock_click_link.assert_not_called()
+        mock_save.assert_called_once()
+    
+    @patch.object(LoginManager, 'is_logged_in')
+    @patch.object(LoginManager, 'load_session')
+    @patch.object(LoginManager, 'click_login_link')
+    def test_login_via_http_disabled_by_default(self, mock_click_link, mock_load, mock_is_logged_in):
+        """Test the HTTP login is not attempted unless enabled in config"""
+        mock_is_logged_in.return_value = False
+        mock_load.return_value = False
+        mock_click_link.return_value = False
+        
+        self.manager.login("user", "pass")
+        
+        self.mock_http_login.assert_not_called()
+        mock_click_link.assert_called_once()
+    
+    @patch.object(LoginManager, 'is_logged_in')
+    @patch.object(LoginManager, 'load_session')
+    @patch.object(LoginManager, 'click_login_link')
+    @patch.object(LoginManager, 'fill_login_form')
+    def test_session_persistence_logs_in_without_second_probe(self, mock_fill_form, mock_click_link,
+                                                              mock_load, mock_is_logged_in):
+        """Test login_with_session_persistence reuses its own homepage load and probe"""
+        mock_is_logged_in.side_effect = [False, True]
+        mock_click_link.return_value = True
+        mock_fill_form.return_value = True
+        
+        with patch.object(self.manager, 'save_session'), \
+             patch.object(self.manager, 'login') as mock_login:
+            result = self.manager.login_with_session_persistence("user", "pass")
+        
+        self.assertTrue(result)
+        mock_login.assert_not_called()
+        self.mock_driver.get.assert_called_once_with("https://www.karaoke-version.com")
+        self.assertEqual(mock_is_logged_in.call_count, 2)
+        mock_fill_form.assert_called_once_with("user", "pass")
+    
+    def test_login_many_runs_one_manager_per_session(self):
+        """Test login_many logs each account in with its own driver"""
+        drivers = [Mock(), Mock()]
+        sessions = [(driver, Mock(), f"/tmp/session_{i}.json") for i, driver in enumerate(drivers)]
+        credentials = [{'username': "a", 'password': "1"}, {'username': "b", 'password': "2"}]
+        
+        with patch.object(LoginManager, 'login', autospec=True, side_effect=[True, False]) as mock_login:
+            results = LoginManager.login_many(sessions, credentials)
+        
+        self.assertEqual(sorted(results), [False, True])
+        used_drivers = {call_args[0][0].driver for call_args in mock_login.call_args_list}
+        self.assertEqual(used_drivers, set(drivers))
+    
+    def test_login_many_rejects_mismatched_lengths(self):
+        """Test login_many requires one credential set per session"""
+        with self.assertRaises(ValueError):
+            LoginManager.login_many([(Mock(), Mock(), "s.json")], [])
+
+
+class TestHttpLogin(TestCase):
+    """Test direct HTTP login with cookie injection"""
+    
+    def setUp(self):
+        """Set up LoginManager with mock dependencies"""
+        self.mock_driver = Mock()
+        self.mock_driver.current_url = "about:blank"
+        self.mock_wait = Mock()
+        self.manager = LoginManager(self.mock_driver, self.mock_wait)
+    
+    def _cookie(self, name, value):
+        """Build a site cookie as found in a requests cookie jar"""
+        cookie = Mock(domain=".karaoke-version.com", path="/", value=value)
+        cookie.name = name
+        return cookie
+    
+    def _mock_http_session(self, mock_session_class, page_cookies, login_cookies,
+                           redirected=True, final_url="https://www.karaoke-version.com/my/"):
+        """Configure a requests.Session mock for the login page GET and login POST"""
+        http = mock_session_class.return_value.__enter__.return_value
+        http.get.return_value.text = (
+            '<form><input type="hidden" name="token" value="xyz">'
+            '<input name="frm_login"></form>'
+        )
+        http.cookies = page_cookies
+        
+        def post(*args, **kwargs):
+            http.cookies = login_cookies
+            response = Mock(url=final_url)
+            response.history = [Mock(status_code=302)] if redirected else []
+            return response
+        
+        http.post.side_effect = post
+        return http
+    
+    @patch('packages.authentication.login_manager.requests.Session')
+    def test_login_via_http_injects_cookies(self, mock_session_class):
+        """Test HTTP login posts credentials and copies only the session cookies to the driver"""
+        consent = self._cookie("consent", "yes")
+        session = self._cookie("session_id", "abc123")
+        http = self._mock_http_session(mock_session_class, [consent], [consent, session])
+        
+        with patch.object(self.manager, 'is_logged_in', return_value=True):
+            result = self.manager._login_via_http("user", "pass")
+        
+        self.assertTrue(result)
+        posted = http.post.call_args[1]['data']
+        self.assertEqual(posted['token'], "xyz")
+        self.assertEqual(posted['frm_login'], "user")
+        self.assertEqual(posted['frm_password'], "pass")
+        self.mock_driver.get.assert_called_once_with("https://www.karaoke-version.com")
+        self.mock_driver.add_cookie.assert_called_once_with({
+            'name': "session_id", 'value': "abc123",
+            'domain': ".karaoke-version.com", 'path': "/"
+        })
+        self.mock_driver.refresh.assert_called_once()
+    
+    @patch('packages.authentication.login_manager.requests.Session')
+    def test_login_via_http_request_failure(self, mock_session_class):
+        """Test HTTP errors fall back without touching the browser"""
+        import requests
+        http = self._mock_http_session(mock_session_class, [], [])
+        http.post.side_effect = requests.ConnectionError("offline")
+        
+        result = self.manager._login_via_http("user", "pass")
+        
+        self.assertFalse(result)
+        self.mock_driver.add_cookie.assert_not_called()
+    
+    @patch('packages.authentication.login_manager.requests.Session')
+    def test_login_via_http_rejected_post(self, mock_session_class):
+        """Test a POST that re-renders the login page leaves the browser alone"""
+        consent = self._cookie("consent", "yes")
+        self._mock_http_session(mock_session_class, [consent], [consent, self._cookie("sid", "1")],
+                                redirected=False, final_url="https://www.karaoke-version.com/login")
+        
+        result = self.manager._login_via_http("user", "pass")
+        
+        self.assertFalse(result)
+        self.mock_driver.get.assert_not_called()
+        self.mock_driver.add_cookie.assert_not_called()
+        self.mock_driver.refresh.assert_not_called()
+    
+    @patch('packages.authentication.login_manager.requests.Session')
+    def test_login_via_http_without_new_cookies(self, mock_session_class):
+        """Test cookies already set by the login page do not count as a session"""
+        consent = self._cookie("consent", "yes")
+        self._mock_http_session(mock_session_class, [consent], [consent])
+        
+        result = self.manager._login_via_http("user", "pass")
+        
+        self.assertFalse(result)
+        self.mock_driver.get.assert_not_called()
 
 
 class TestSessionPersistence(TestCase):
@@ -341,7 +718,7 @@ class TestSessionPersistence(TestCase):
         self.mock_driver = Mock()
         self.mock_wait = Mock()
         self.temp_dir = tempfile.mkdtemp()
-        self.session_file = Path(self.temp_dir) / "test_session.pkl"
+        self.session_file = Path(self.temp_dir) / "test_session.json"
         self.manager = LoginManager(self.mock_driver, self.mock_wait, str(self.session_file))
     
     def tearDown(self):
@@ -352,34 +729,193 @@ class TestSessionPersistence(TestCase):
     
     def test_save_session_creates_file(self):
         """Test save_session creates session file with cookies"""
-        # Use simple dict data that can be pickled, not Mock objects
+        # Use simple dict data that can be serialized, not Mock objects
         simple_cookies = [
             {"name": "session_id", "value": "abc123"},
             {"name": "user_pref", "value": "dark_mode"}
         ]
         self.mock_driver.get_cookies.return_value = simple_cookies
+        self.mock_driver.execute_script.return_value = {}
         
         result = self.manager.save_session()
+        self.manager.wait_for_session_save()
         
         self.assertTrue(result)
         self.assertTrue(self.session_file.exists())
         
         # Verify session data was saved
-        with open(self.session_file, 'rb') as f:
-            saved_data = pickle.load(f)
+        saved_data = json.loads(self.session_file.read_text())
             
         self.assertIn('cookies', saved_data)
         self.assertIn('timestamp', saved_data)
         self.assertEqual(saved_data['cookies'], simple_cookies)
     
+    def test_save_session_reads_page_state_in_one_call(self):
+        """Test storage and URL are read with one script call"""
+        self.mock_driver.get_cookies.return_value = [{"name": "session_id", "value": "abc123"}]
+        self.mock_driver.execute_script.return_value = {
+            'url': "https://www.karaoke-version.com/my/index.html",
+            'localStorage': {'pref': "1"},
+            'sessionStorage': {}
+        }
+        
+        self.assertTrue(self.manager.save_session())
+        self.manager.wait_for_session_save()
+        
+        self.mock_driver.execute_script.assert_called_once()
+        self.mock_driver.get_window_size.assert_not_called()
+        saved_data = json.loads(self.session_file.read_text())
+        self.assertEqual(saved_data['url'], "https://www.karaoke-version.com/my/index.html")
+        self.assertEqual(saved_data['localStorage'], {'pref': "1"})
+        self.assertEqual(saved_data['version'], 1)
+        # Nothing restores these, so they are not collected
+        self.assertNotIn('user_agent', saved_data)
+        self.assertNotIn('window_size', saved_data)
+    
+    def test_save_session_replaces_file_atomically(self):
+        """Test the session file is swapped in whole, leaving no temp file behind"""
+        self.mock_driver.get_cookies.return_value = []
+        self.mock_driver.execute_script.return_value = {}
+        self.session_file.write_text("old")
+        
+        self.assertTrue(self.manager.save_session())
+        self.manager.wait_for_session_save()
+        
+        self.assertIn('timestamp', json.loads(self.session_file.read_text()))
+        self.assertFalse(self.session_file.with_name(self.session_file.name + ".tmp").exists())
+    
+    def _mock_remote_executor(self):
+        """Give the mock driver a WebDriver server URL and session id"""
+        self.mock_driver.get_cookies.return_value = []
+        self.mock_driver.execute_script.return_value = {}
+        self.mock_driver.command_executor = Mock(spec=RemoteConnection)
+        self.mock_driver.command_executor.client_config.remote_server_addr = "http://localhost:9515"
+        self.mock_driver.session_id = "abc123"
+    
+    def test_save_session_records_webdriver_session_when_enabled(self):
+        """Test the browser's WebDriver session is saved for attach() on request"""
+        self._mock_remote_executor()
+        manager = LoginManager(self.mock_driver, self.mock_wait, str(self.session_file),
+                               remember_browser=True)
+        
+        manager.save_session()
+        manager.wait_for_session_save()
+        
+        saved_data = json.loads(self.session_file.read_text())
+        self.assertEqual(saved_data['webdriver'],
+                         {'executor_url': "http://localhost:9515", 'session_id': "abc123"})
+    
+    def test_save_session_omits_webdriver_session_by_default(self):
+        """Test the WebDriver session is not written next to the cookies unless asked"""
+        self._mock_remote_executor()
+        
+        self.manager.save_session()
+        self.manager.wait_for_session_save()
+        
+        self.assertNotIn('webdriver', json.loads(self.session_file.read_text()))
+    
+    def test_attached_remote_bounds_requests(self):
+        """Test the reattached driver gives up on an unresponsive session"""
+        driver = _AttachedRemote("http://localhost:9515", "abc123")
+        
+        self.assertEqual(driver.session_id, "abc123")
+        self.assertEqual(driver.command_executor.client_config.timeout, 10)
+    
+    @patch('packages.authentication.login_manager._AttachedRemote')
+    def test_attach_reuses_saved_webdriver_session(self, mock_remote):
+        """Test attach() drives the recorded browser session with a working wait"""
+        self.session_file.write_text(json.dumps({
+            'webdriver': {'executor_url': "http://localhost:9515", 'session_id': "abc123"}
+        }))
+        
+        manager = LoginManager.attach(str(self.session_file))
+        
+        mock_remote.assert_called_once_with("http://localhost:9515", "abc123")
+        self.assertIs(manager.driver, mock_remote.return_value)
+        self.assertIsInstance(manager.wait, WebDriverWait)
+        self.assertIs(manager.wait._driver, mock_remote.return_value)
+        self.assertTrue(manager.remember_browser)
+    
+    @patch('packages.authentication.login_manager._AttachedRemote')
+    def test_attach_waits_for_pending_save(self, mock_remote):
+        """Test attach() reads a session file only after queued writes finish"""
+        self._mock_remote_executor()
+        LoginManager(self.mock_driver, self.mock_wait, str(self.session_file),
+                     remember_browser=True).save_session()
+        
+        self.assertIsNotNone(LoginManager.attach(str(self.session_file)))
+        mock_remote.assert_called_once_with("http://localhost:9515", "abc123")
+    
+    def test_attach_without_saved_webdriver_session(self):
+        """Test attach() returns None when no browser was recorded"""
+        self.session_file.write_text(json.dumps({'cookies': []}))
+        
+        self.assertIsNone(LoginManager.attach(str(self.session_file)))
+    
     @patch('packages.authentication.login_manager.logging.info')
     def test_save_session_logging(self, mock_log):
         """Test save_session logs success message"""
         self.mock_driver.get_cookies.return_value = []
+        self.mock_driver.execute_script.return_value = {}
+        
+        self.manager.save_session()
+        self.manager.wait_for_session_save()
+        
+        mock_log.assert_any_call("💾 Session data saved to %s", self.session_file)
+    
+    def test_save_session_writes_in_background(self):
+        """Test save_session hands the file write to the session writer thread"""
+        self.mock_driver.get_cookies.return_value = []
+        self.mock_driver.execute_script.return_value = {}
+        
+        with patch.object(LoginManager, '_session_writer') as mock_writer:
+            self.assertTrue(self.manager.save_session())
+        
+        mock_writer.submit.assert_called_once()
+        self.assertEqual(mock_writer.submit.call_args[0][0], self.manager._write_session_file)
+        self.assertFalse(self.session_file.exists())
+    
+    def test_load_session_waits_for_pending_save(self):
+        """Test a second manager sees a session saved moments earlier"""
+        self.mock_driver.get_cookies.return_value = [{"name": "a", "value": "1"}]
+        self.mock_driver.execute_script.return_value = {}
+        self.manager.save_session()
+        
+        manager2 = LoginManager(Mock(), Mock(), str(self.session_file))
+        
+        self.assertEqual(manager2._load_and_validate_session_data()['cookies'],
+                         [{"name": "a", "value": "1"}])
+    
+    def test_save_session_sets_mtime_to_timestamp(self):
+        """Test the saved file's mtime matches its embedded timestamp"""
+        self.mock_driver.get_cookies.return_value = []
+        self.mock_driver.execute_script.return_value = {}
         
         self.manager.save_session()
+        self.manager.wait_for_session_save()
+        
+        saved_data = json.loads(self.session_file.read_text())
+        self.assertAlmostEqual(self.session_file.stat().st_mtime, saved_data['timestamp'], places=3)
+    
+    def test_is_session_valid_uses_file_age(self):
+        """Test session validity comes from the file's mtime without parsing it"""
+        import os
+        import time
+        self.assertFalse(self.manager.is_session_valid())
+        
+        self.session_file.write_text("{}")
+        self.assertTrue(self.manager.is_session_valid())
         
-        mock_log.assert_called_with(f"💾 Session saved to {self.session_file}")
+        old_mtime = time.time() - (25 * 60 * 60)
+        os.utime(self.session_file, (old_mtime, old_mtime))
+        self.assertFalse(self.manager.is_session_valid())
+    
+    def test_clear_session_file_without_driver(self):
+        """Test a saved session file can be deleted without a browser"""
+        self.session_file.write_text(json.dumps({'version': 1, 'cookies': []}))
+        
+        self.assertTrue(LoginManager.clear_session_file(str(self.session_file)))
+        self.assertFalse(self.session_file.exists())
     
     def test_load_session_file_not_exists(self):
         """Test load_session when session file doesn't exist"""
@@ -392,18 +928,162 @@ class TestSessionPersistence(TestCase):
         # Create a session file
         import time
         session_data = {
+            'version': 1,
             'cookies': [{"name": "test", "value": "123"}],
             'timestamp': time.time()
         }
         
-        with open(self.session_file, 'wb') as f:
-            pickle.dump(session_data, f)
+        self.session_file.write_text(json.dumps(session_data))
+        self.mock_driver.current_url = "https://www.karaoke-version.com/my/index.html"
         
         result = self.manager.load_session()
         
         self.assertTrue(result)
-        self.mock_driver.delete_all_cookies.assert_called_once()
-        self.mock_driver.add_cookie.assert_called_once_with({"name": "test", "value": "123"})
+        self.mock_driver.execute_cdp_cmd.assert_called_once_with('Network.setCookies', {
+            'cookies': [{'name': "test", 'value': "123", 'path': "/", 'secure': False,
+                         'httpOnly': False, 'url': "https://www.karaoke-version.com"}]
+        })
+    
+    def test_session_data_parsed_once_while_unchanged(self):
+        """Test repeat loads reuse the parsed file until it changes on disk"""
+        import time
+        self.session_file.write_text(json.dumps({'version': 1, 'cookies': [], 'timestamp': time.time()}))
+        
+        with patch('packages.authentication.login_manager.json.loads', wraps=json.loads) as mock_loads:
+            first = self.manager._load_and_validate_session_data()
+            first['cookies'] = None
+            second = self.manager._load_and_validate_session_data()
+            
+            self.session_file.write_text(json.dumps({'version': 1, 'cookies': [{"name": "a"}], 'timestamp': time.time()}))
+            third = self.manager._load_and_validate_session_data()
+        
+        self.assertEqual(second['cookies'], [])
+        self.assertEqual(third['cookies'], [{"name": "a"}])
+        self.assertEqual(mock_loads.call_count, 2)
+    
+    def test_load_session_discards_other_schema_version(self):
+        """Test a session file written in another format is ignored and removed"""
+        import time
+        self.session_file.write_text(json.dumps({
+            'version': 0,
+            'cookies': [{"name": "test", "value": "123"}],
+            'timestamp': time.time()
+        }))
+        
+        self.assertFalse(self.manager.load_session())
+        self.assertFalse(self.session_file.exists())
+        self.mock_driver.execute_cdp_cmd.assert_not_called()
+    
+    def test_load_session_discards_unversioned_file(self):
+        """Test a session file without a schema version is treated as outdated"""
+        import time
+        self.session_file.write_text(json.dumps({'cookies': [], 'timestamp': time.time()}))
+        
+        self.assertFalse(self.manager.load_session())
+        self.assertFalse(self.session_file.exists())
+    
+    def test_restore_cookies_uses_single_cdp_call(self):
+        """Test all cookies are restored with one Network.setCookies call"""
+        cookies = [
+            {"name": "a", "value": "1", "domain": ".karaoke-version.com", "expiry": 1700000000},
+            {"name": "b", "value": "2", "domain": ".karaoke-version.com", "sameSite": "Lax"}
+        ]
+        
+        self.manager._restore_cookies(cookies)
+        
+        params = self.mock_driver.execute_cdp_cmd.call_args[0][1]
+        self.assertEqual(len(params['cookies']), 2)
+        self.assertEqual(params['cookies'][0]['expires'], 1700000000.0)
+        self.assertEqual(params['cookies'][1]['sameSite'], "Lax")
+        self.mock_driver.add_cookie.assert_not_called()
+    
+    def test_restore_cookies_cdp_skips_foreign_domains(self):
+        """Test the CDP path drops other sites' cookies and unknown attributes"""
+        cookies = [
+            {"name": "site", "value": "1", "domain": ".karaoke-version.com", "size": 5, "expiry": "oops"},
+            {"name": "tracker", "value": "2", "domain": ".ads.example.com"}
+        ]
+        
+        self.manager._restore_cookies(cookies)
+        
+        self.mock_driver.execute_cdp_cmd.assert_called_once_with('Network.setCookies', {
+            'cookies': [{'name': "site", 'value': "1", 'path': "/", 'secure': False,
+                         'httpOnly': False, 'domain': ".karaoke-version.com"}]
+        })
+    
+    def test_restore_cookies_falls_back_without_cdp(self):
+        """Test cookies are added one by one when CDP is unavailable"""
+        from selenium.common.exceptions import WebDriverException
+        self.mock_driver.execute_cdp_cmd.side_effect = WebDriverException("no CDP")
+        
+        self.manager._restore_cookies([{"name": "a", "value": "1", "expiry": 1700000000.5}])
+        
+        self.mock_driver.add_cookie.assert_called_once_with(
+            {"name": "a", "value": "1", "expiry": 1700000000}
+        )
+    
+    def test_restore_cookies_scrubs_before_restoring(self):
+        """Test foreign-domain cookies and unknown attributes are dropped up front"""
+        self.mock_driver.execute_cdp_cmd.side_effect = AttributeError("no CDP")
+        cookies = [
+            {"name": "site", "value": "1", "domain": ".karaoke-version.com", "size": 5, "expiry": "oops"},
+            {"name": "tracker", "value": "2", "domain": ".ads.example.com"}
+        ]
+        
+        self.manager._restore_cookies(cookies)
+        
+        self.mock_driver.add_cookie.assert_called_once_with(
+            {"name": "site", "value": "1", "domain": ".karaoke-version.com"}
+        )
+    
+    def test_restore_storage_single_script_call(self):
+        """Test localStorage and sessionStorage are restored together"""
+        self.manager._restore_storage({"theme": "dark", "count": 3}, {"tab": "mixer"})
+        
+        self.mock_driver.execute_script.assert_called_once()
+        args = self.mock_driver.execute_script.call_args[0]
+        self.assertEqual(args[1], {"theme": "dark", "count": "3"})
+        self.assertEqual(args[2], {"tab": "mixer"})
+    
+    def test_load_session_single_navigation(self):
+        """Test cookies are installed before one account-page load verifies them"""
+        import time
+        self.session_file.write_text(json.dumps({
+            'version': 1,
+            'cookies': [{"name": "test", "value": "123", "domain": ".karaoke-version.com"}],
+            'localStorage': {'pref': "1"},
+            'timestamp': time.time()
+        }))
+        self.mock_driver.current_url = "https://www.karaoke-version.com/my/index.html"
+        
+        with patch.object(self.manager, 'is_logged_in', return_value=True) as mock_is_logged_in:
+            result = self.manager.load_session()
+        
+        self.assertTrue(result)
+        # Staying on the members-only account page is proof enough
+        mock_is_logged_in.assert_not_called()
+        self.mock_driver.execute_cdp_cmd.assert_called_once()
+        self.mock_driver.get.assert_called_once_with("https://www.karaoke-version.com/my/index.html")
+        self.mock_driver.refresh.assert_not_called()
+    
+    def test_load_session_redirected_to_login(self):
+        """Test a login redirect from the account page rejects the saved session"""
+        import time
+        self.session_file.write_text(json.dumps({'version': 1, 'cookies': [], 'timestamp': time.time()}))
+        self.mock_driver.current_url = "https://www.karaoke-version.com/login"
+        
+        self.assertFalse(self.manager.load_session())
+    
+    def test_load_session_probes_page_when_moved_off_account_area(self):
+        """Test an unexpected landing page falls back to the login probe"""
+        import time
+        self.session_file.write_text(json.dumps({'version': 1, 'cookies': [], 'timestamp': time.time()}))
+        self.mock_driver.current_url = "https://www.karaoke-version.com/"
+        
+        with patch.object(self.manager, 'is_logged_in', return_value=False) as mock_is_logged_in:
+            self.assertFalse(self.manager.load_session())
+        
+        mock_is_logged_in.assert_called_once()
     
     def test_load_session_expired(self):
         """Test loading expired session (older than 24 hours)"""
@@ -412,12 +1092,12 @@ class TestSessionPersistence(TestCase):
         # Create expired session (25 hours old)
         old_timestamp = time.time() - (25 * 60 * 60)
         session_data = {
+            'version': 1,
             'cookies': [{"name": "test", "value": "123"}],
             'timestamp': old_timestamp
         }
         
-        with open(self.session_file, 'wb') as f:
-            pickle.dump(session_data, f)
+        self.session_file.write_text(json.dumps(session_data))
         
         result = self.manager.load_session()
         
@@ -425,8 +1105,8 @@ class TestSessionPersistence(TestCase):
         # Expired session file should be removed
         self.assertFalse(self.session_file.exists())
     
-    @patch('packages.authentication.login_manager.logging.error')
-    def test_load_session_corrupted_file(self, mock_log_error):
+    @patch('packages.authentication.login_manager.logging.info')
+    def test_load_session_corrupted_file(self, mock_log_info):
         """Test loading corrupted session file"""
         # Create corrupted file
         with open(self.session_file, 'w') as f:
@@ -435,7 +1115,7 @@ class TestSessionPersistence(TestCase):
         result = self.manager.load_session()
         
         self.assertFalse(result)
-        mock_log_error.assert_called_once()
+        mock_log_info.assert_any_call("🗑️ Saved session file is not valid JSON, discarding it")
         # Corrupted file should be removed
         self.assertFalse(self.session_file.exists())
 
@@ -449,25 +1129,26 @@ class TestCookieManagement(TestCase):
         self.mock_wait = Mock()
         self.manager = LoginManager(self.mock_driver, self.mock_wait)
     
-    @patch.object(LoginManager, '_emergency_cookie_fallback')
-    def test_fallback_cookie_logout(self, mock_emergency):
-        """Test fallback cookie logout clears cookies"""
-        mock_emergency.return_value = True
-        
+    def test_fallback_cookie_logout(self):
+        """Test cookie logout clears cookies, skips the refresh and reports logged out"""
         result = self.manager._fallback_cookie_logout()
         
         self.assertTrue(result)
         self.mock_driver.delete_all_cookies.assert_called_once()
-        mock_emergency.assert_called_once()
+        self.mock_driver.refresh.assert_not_called()
+        self.assertTrue(self.manager._needs_reload)
+        self.assertFalse(self.manager.is_logged_in())
+        self.mock_driver.execute_script.assert_not_called()
     
-    def test_emergency_cookie_fallback_refresh_check(self):
-        """Test emergency cookie fallback refreshes and checks login status"""
-        with patch.object(self.manager, 'is_logged_in', return_value=False) as mock_is_logged_in:
-            result = self.manager._emergency_cookie_fallback()
-            
-            self.assertTrue(result)
-            self.mock_driver.refresh.assert_called_once()
-            mock_is_logged_in.assert_called_once()
+    def test_emergency_cookie_fallback_skips_refresh(self):
+        """Test emergency cookie fallback clears cookies without refreshing"""
+        result = self.manager._emergency_cookie_fallback()
+        
+        self.assertTrue(result)
+        self.mock_driver.delete_all_cookies.assert_called_once()
+        self.mock_driver.refresh.assert_not_called()
+        self.assertTrue(self.manager._needs_reload)
+        self.assertFalse(self.manager.is_logged_in())
 
 
 class TestLoginFormInteraction(TestCase):
@@ -484,8 +1165,7 @@ class TestLoginFormInteraction(TestCase):
         """Test successful login link clicking"""
         mock_element = Mock()
         mock_element.text = "Log in"
-        mock_element.is_displayed.return_value = True
-        self.mock_driver.find_element.return_value = mock_element
+        self.mock_driver.execute_script.return_value = mock_element
         
         result = self.manager.click_login_link()
         
@@ -496,7 +1176,7 @@ class TestLoginFormInteraction(TestCase):
     
     def test_click_login_link_not_found(self):
         """Test login link clicking when element not found"""
-        self.mock_driver.find_element.side_effect = NoSuchElementException("Not found")
+        self.mock_driver.execute_script.return_value = None
         
         result = self.manager.click_login_link()
         
@@ -540,10 +1220,14 @@ class TestAuthenticationIntegration(TestCase):
     def setUp(self):
         """Set up LoginManager with mock dependencies"""
         self.mock_driver = Mock()
+        self.mock_driver.current_url = "about:blank"
         self.mock_wait = Mock()
         self.temp_dir = tempfile.mkdtemp()
-        self.session_file = Path(self.temp_dir) / "integration_session.pkl"
+        self.session_file = Path(self.temp_dir) / "integration_session.json"
         self.manager = LoginManager(self.mock_driver, self.mock_wait, str(self.session_file))
+        http_login = patch.object(LoginManager, '_login_via_http', return_value=False)
+        http_login.start()
+        self.addCleanup(http_login.stop)
     
     def tearDown(self):
         """Clean up temporary files"""
@@ -583,7 +1267,7 @@ class TestAuthenticationIntegration(TestCase):
         
         self.assertTrue(result)
         mock_driver2.delete_all_cookies.assert_called_once()
-        mock_driver2.add_cookie.assert_called_once_with({"name": "test_session", "value": "abc123"})
+        mock_driver2.execute_cdp_cmd.assert_called_once()
 
 
 if __name__ == "__main__":
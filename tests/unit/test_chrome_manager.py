@@ -1,9 +1,10 @@
 """Unit tests for Chrome browser management functionality"""
 
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, patch, call
 import os
 import logging
+import tempfile
 from pathlib import Path
 import pytest
 
@@ -16,6 +17,13 @@ class TestChromeManager(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures"""
         self.chrome_manager = ChromeManager(headless=True)
+        # Keep the ChromeDriver path cache out of the working directory
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.driver_cache = Path(temp_dir.name) / "chromedriver.json"
+        cache_patch = patch('packages.browser.chrome_manager._DRIVER_PATH_CACHE', self.driver_cache)
+        cache_patch.start()
+        self.addCleanup(cache_patch.stop)
 
     def test_init_headless_mode(self):
         """Test ChromeManager initialization in headless mode"""
@@ -61,7 +69,7 @@ class TestChromeManager(unittest.TestCase):
 
             # Verify Chrome was called with correct parameters
             mock_chrome.assert_called_once()
-            mock_wait.assert_called_once_with(mock_driver, 10)
+            mock_wait.assert_called_once_with(mock_driver, 10, poll_frequency=0.1)
 
     @patch('packages.browser.chrome_manager.webdriver.Chrome')
     def test_setup_driver_failure(self, mock_chrome):
@@ -94,10 +102,11 @@ class TestChromeManager(unittest.TestCase):
             options = manager._configure_chrome_options()
 
             # Verify headless arguments were added
-            mock_options.add_argument.assert_any_call("--headless")
+            mock_options.add_argument.assert_any_call("--headless=new")
             mock_options.add_argument.assert_any_call("--no-sandbox")
             mock_options.add_argument.assert_any_call("--disable-dev-shm-usage")
-            mock_options.add_argument.assert_any_call("--disable-gpu")
+            # GPU is already off in new headless mode
+            self.assertNotIn(call("--disable-gpu"), mock_options.add_argument.call_args_list)
 
     def test_configure_chrome_options_visible(self):
         """Test Chrome options configuration for visible mode"""
@@ -115,6 +124,10 @@ class TestChromeManager(unittest.TestCase):
             headless_calls = [call for call in mock_options.add_argument.call_args_list 
                             if '--headless' in str(call)]
             self.assertEqual(len(headless_calls), 0)
+            # Same-origin policy stays on; background services stay off
+            self.assertNotIn(call("--disable-web-security"), mock_options.add_argument.call_args_list)
+            mock_options.add_argument.assert_any_call("--disable-background-networking")
+            mock_options.add_argument.assert_any_call("--disable-renderer-backgrounding")
 
     @patch('packages.browser.chrome_manager.os.path.exists')
     def test_configure_chrome_options_with_chrome_binary(self, mock_exists):
@@ -149,6 +162,21 @@ class TestChromeManager(unittest.TestCase):
             mock_service.assert_called_once_with("/opt/homebrew/bin/chromedriver")
             self.assertEqual(service, mock_service_instance)
 
+    @patch('packages.browser.chrome_manager.shutil.which')
+    @patch('packages.browser.chrome_manager.os.path.exists')
+    @patch('packages.browser.chrome_manager.ChromeDriverManager')
+    def test_get_chrome_service_found_in_path(self, mock_driver_manager, mock_exists, mock_which):
+        """Test a ChromeDriver on PATH is used without downloading"""
+        mock_exists.return_value = False
+        mock_which.return_value = "/usr/bin/chromedriver"
+
+        with patch('packages.browser.chrome_manager.Service') as mock_service:
+            self.chrome_manager._get_chrome_service()
+
+        mock_which.assert_called_once_with("chromedriver")
+        self.assertEqual(mock_service.call_args[0][0], "/usr/bin/chromedriver")
+        mock_driver_manager.assert_not_called()
+
     @patch('packages.browser.chrome_manager.os.path.exists')
     @patch('packages.browser.chrome_manager.ChromeDriverManager')
     def test_get_chrome_service_download_fallback(self, mock_driver_manager, mock_exists):
@@ -168,6 +196,20 @@ class TestChromeManager(unittest.TestCase):
             mock_manager.install.assert_called_once()
             mock_service.assert_called_once_with("/downloaded/chromedriver")
 
+    @patch('packages.browser.chrome_manager.os.path.exists')
+    @patch('packages.browser.chrome_manager.ChromeDriverManager')
+    def test_get_chrome_service_reuses_downloaded_driver(self, mock_driver_manager, mock_exists):
+        """Test a driver downloaded on a previous run skips webdriver-manager"""
+        mock_exists.side_effect = lambda path: path == "/downloaded/chromedriver"
+        mock_driver_manager.return_value.install.return_value = "/downloaded/chromedriver"
+
+        with patch('packages.browser.chrome_manager.Service') as mock_service:
+            self.chrome_manager._get_chrome_service()
+            self.chrome_manager._get_chrome_service()
+
+        mock_driver_manager.return_value.install.assert_called_once()
+        self.assertEqual(mock_service.call_args[0][0], "/downloaded/chromedriver")
+
     @patch('packages.browser.chrome_manager.os.path.exists')
     @patch('packages.browser.chrome_manager.ChromeDriverManager')
     def test_get_chrome_service_download_failure(self, mock_driver_manager, mock_exists):
@@ -221,6 +263,54 @@ class TestChromeManager(unittest.TestCase):
         self.chrome_manager.set_download_path(test_path)
         # Just verify no exception was raised
 
+    @patch('time.sleep')
+    def test_wait_for_downloads_backs_off(self, mock_sleep):
+        """Test active downloads are re-checked quickly, then less often"""
+        import tempfile
+        self.chrome_manager.driver = Mock()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            partial = Path(temp_dir) / "track.mp3.crdownload"
+            partial.write_text("")
+            sleeps = []
+
+            def finish_after_three(delay):
+                sleeps.append(delay)
+                if len(sleeps) == 3:
+                    partial.unlink()
+            mock_sleep.side_effect = finish_after_three
+
+            self.chrome_manager.wait_for_downloads_to_complete(temp_dir, timeout=60)
+
+        self.assertEqual(sleeps, [0.1, 0.2, 0.4])
+
+    def test_count_active_downloads_checks_song_folders(self):
+        """Test partial downloads are found at the top level and one folder down"""
+        import tempfile
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / "a.mp3.crdownload").write_text("")
+            (root / "Song").mkdir()
+            (root / "Song" / "b.mp3.crdownload").write_text("")
+            (root / "Song" / "done.mp3").write_text("")
+
+            self.assertEqual(ChromeManager._count_active_downloads(temp_dir), 2)
+        self.assertEqual(ChromeManager._count_active_downloads(temp_dir), 0)
+
+    def test_reset_session_keeps_browser(self):
+        """Test reset_session clears site state without quitting Chrome"""
+        mock_driver = Mock()
+        self.chrome_manager.driver = mock_driver
+
+        self.chrome_manager.reset_session()
+
+        mock_driver.execute_cdp_cmd.assert_any_call('Network.clearBrowserCookies', {})
+        mock_driver.execute_cdp_cmd.assert_any_call('Storage.clearDataForOrigin', {
+            'origin': "https://www.karaoke-version.com",
+            'storageTypes': 'all'
+        })
+        mock_driver.get.assert_called_once_with("about:blank")
+        mock_driver.quit.assert_not_called()
+
     def test_quit_with_driver(self):
         """Test quitting when driver exists"""
         mock_driver = Mock()
@@ -125,9 +125,7 @@ class TestCLIArguments(unittest.TestCase):
     def test_clear_session_execution(self, mock_exit, mock_print, mock_login_manager_class):
         """Test clear session execution path"""
         # Mock the LoginManager
-        mock_login_manager = Mock()
-        mock_login_manager.clear_session.return_value = True
-        mock_login_manager_class.return_value = mock_login_manager
+        mock_login_manager_class.clear_session_file.return_value = True
         
         # Simulate the clear session logic
         parser = argparse.ArgumentParser()
@@ -136,8 +134,7 @@ class TestCLIArguments(unittest.TestCase):
         
         if args.clear_session:
             from packages.authentication import LoginManager
-            temp_login = LoginManager(None, None)
-            if temp_login.clear_session():
+            if LoginManager.clear_session_file():
                 mock_print("✅ Saved session data cleared successfully")
             else:
                 mock_print("❌ Could not clear session data")
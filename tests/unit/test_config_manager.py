@@ -0,0 +1,167 @@
+"""Unit tests for songs configuration loading"""
+
+import os
+import unittest
+from unittest.mock import patch
+
+import yaml
+
+from packages.configuration.config_manager import ConfigurationManager
+from tests.yaml_test_helpers import StandardYAMLContent, YAMLTestHelper
+
+
+class TestConfigurationManagerCache(unittest.TestCase):
+    """Test cases for the parsed songs cache"""
+
+    def setUp(self):
+        """Set up a temporary songs.yaml"""
+        self.config_file = YAMLTestHelper.create_temp_yaml_file(
+            StandardYAMLContent.get_valid_songs_config()
+        )
+        self.addCleanup(YAMLTestHelper.cleanup_temp_file, self.config_file)
+        self.config_manager = ConfigurationManager(self.config_file)
+
+    def test_unchanged_file_is_parsed_once(self):
+        """Test repeated loads of an unchanged file reuse the parsed songs"""
+        with patch('packages.configuration.config_manager.yaml.load',
+                   wraps=yaml.load) as mock_load:
+            first = self.config_manager.load_songs_config()
+            second = self.config_manager.load_songs_config()
+
+        self.assertEqual(mock_load.call_count, 1)
+        self.assertEqual(first, second)
+        # Callers get their own copies
+        second[0]['name'] = 'Changed'
+        self.assertNotEqual(self.config_manager.load_songs_config()[0]['name'], 'Changed')
+
+    def test_modified_file_is_reloaded(self):
+        """Test a change to the file invalidates the cache"""
+        songs = self.config_manager.load_songs_config()
+
+        minimal = StandardYAMLContent.get_minimal_songs_config()
+        replacement = YAMLTestHelper.create_temp_yaml_file(minimal)
+        self.addCleanup(YAMLTestHelper.cleanup_temp_file, replacement)
+        os.replace(replacement, self.config_file)
+        stat = os.stat(self.config_file)
+        os.utime(self.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        reloaded = self.config_manager.load_songs_config()
+
+        self.assertEqual(len(reloaded), len(minimal['songs']))
+        self.assertNotEqual(len(reloaded), len(songs))
+
+    def test_invalidate_cache_forces_reparse(self):
+        """Test invalidate_cache makes the next load re-read the file"""
+        self.config_manager.load_songs_config()
+        self.config_manager.invalidate_cache()
+
+        with patch('packages.configuration.config_manager.yaml.load',
+                   wraps=yaml.load) as mock_load:
+            self.config_manager.load_songs_config()
+
+        mock_load.assert_called_once()
+
+    def test_reassigned_config_file_is_used(self):
+        """Test a reassigned songs_config_file is read on the next load"""
+        self.config_manager.load_songs_config()
+
+        minimal = StandardYAMLContent.get_minimal_songs_config()
+        other_file = YAMLTestHelper.create_temp_yaml_file(minimal)
+        self.addCleanup(YAMLTestHelper.cleanup_temp_file, other_file)
+        self.config_manager.songs_config_file = other_file
+
+        self.assertEqual(len(self.config_manager.load_songs_config()), len(minimal['songs']))
+
+    def test_utf8_file_is_decoded_by_yaml(self):
+        """Test non-ASCII names load the same whatever the locale encoding"""
+        with open(self.config_file, 'wb') as file:
+            file.write(
+                "songs:\n"
+                "  - url: https://www.karaoke-version.com/custombackingtrack/beyonce/halo.html\n"
+                "    name: Beyoncé - Halo\n".encode('utf-8')
+            )
+
+        songs = self.config_manager.load_songs_config()
+
+        self.assertEqual(songs[0]['name'], "Beyoncé - Halo")
+
+
+class TestSongNameGeneration(unittest.TestCase):
+    """Test cases for names generated from song URLs"""
+
+    BASE_URL = "https://www.karaoke-version.com/custombackingtrack/"
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.config_manager = ConfigurationManager()
+
+    def test_restore_apostrophes(self):
+        """Test URL slug contractions get their apostrophes back"""
+        cases = {
+            "don-t-stop-believin": "don't-stop-believin",
+            "i-m-yours": "i'm-yours",
+            "we-re-not-gonna-take-it": "we're-not-gonna-take-it",
+            "it-s-my-life": "it's-my-life",
+            "i-ll-be-there": "i'll-be-there",
+            "i-ve-got-you": "i've-got-you",
+            "i-d-do-anything": "i'd-do-anything",
+            "more-than-words": "more-than-words",
+        }
+        for slug, expected in cases.items():
+            with self.subTest(slug=slug):
+                self.assertEqual(self.config_manager._restore_apostrophes(slug), expected)
+
+    def test_generate_name_from_url(self):
+        """Test song-only and artist-prefixed names"""
+        url = self.BASE_URL + "journey/don-t-stop-believin.html"
+
+        self.assertEqual(self.config_manager._generate_name_from_url(url), "Don'T Stop Believin")
+        self.assertEqual(
+            self.config_manager._generate_name_from_url(url, include_artist=True),
+            "Journey - Don'T Stop Believin"
+        )
+        self.assertEqual(
+            self.config_manager._generate_name_from_url("https://example.com/song.html"),
+            "Unknown Song"
+        )
+
+    def test_detect_song_name_conflicts(self):
+        """Test every URL sharing a song name is flagged, and only those"""
+        songs = [
+            {'url': self.BASE_URL + "journey/faithfully.html"},
+            {'url': self.BASE_URL + "bon-jovi/always.html"},
+            {'url': self.BASE_URL + "atlantic-starr/always.html"},
+            {'name': "No URL"},
+            {'url': self.BASE_URL + "erasure/always.html"},
+        ]
+
+        with self.assertLogs('packages.configuration.config_manager', level='INFO') as logs:
+            conflicts = self.config_manager._detect_song_name_conflicts(songs)
+
+        self.assertEqual(conflicts, {
+            self.BASE_URL + "bon-jovi/always.html",
+            self.BASE_URL + "atlantic-starr/always.html",
+            self.BASE_URL + "erasure/always.html",
+        })
+        self.assertIn("Detected 3 songs named 'always'", logs.output[0])
+
+    def test_validate_name(self):
+        """Test folder-name validation rejects reserved characters"""
+        self.assertTrue(self.config_manager._validate_name("Don't Stop Believin"))
+        for char in '<>:"/\\|?*':
+            with self.subTest(char=char):
+                self.assertFalse(self.config_manager._validate_name(f"Song {char} Name"))
+
+    def test_extract_song_name_only(self):
+        """Test the song slug is taken from the last path segment"""
+        url = self.BASE_URL + "bon-jovi/livin-on-a-prayer.html"
+
+        self.assertEqual(self.config_manager._extract_song_name_only(url), "livin-on-a-prayer")
+        self.assertEqual(
+            self.config_manager._extract_song_name_only("https://example.com/x"),
+            "Unknown Song"
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
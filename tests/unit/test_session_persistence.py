@@ -4,6 +4,7 @@ Unit tests for session persistence functionality
 Tests login session saving and restoration
 """
 
+import os
 import sys
 import tempfile
 import time
@@ -22,7 +23,7 @@ def test_session_persistence_logic():
     print("="*60)
     
     # Create temporary session file
-    with tempfile.NamedTemporaryFile(suffix='.pkl', delete=False) as temp_file:
+    with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as temp_file:
         session_file = temp_file.name
     
     try:
@@ -71,15 +72,14 @@ def test_session_persistence_logic():
         print("\n4️⃣ Testing session age limits...")
         
         # Manually modify session to be old
-        import pickle
-        with open(session_file, 'rb') as f:
-            session_data = pickle.load(f)
+        import json
+        session_data = json.loads(Path(session_file).read_text())
         
         # Make session 25 hours old (should be too old)
         session_data['timestamp'] = time.time() - (25 * 60 * 60)
         
-        with open(session_file, 'wb') as f:
-            pickle.dump(session_data, f)
+        Path(session_file).write_text(json.dumps(session_data))
+        os.utime(session_file, (session_data['timestamp'], session_data['timestamp']))
         
         assert not login_manager.is_session_valid(), "Old session should be invalid"
         print("✅ Old session correctly identified as invalid")
@@ -112,7 +112,7 @@ def test_session_workflow():
     print("="*60)
     
     # Create temporary session file
-    with tempfile.NamedTemporaryFile(suffix='.pkl', delete=False) as temp_file:
+    with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as temp_file:
         session_file = temp_file.name
     
     try:
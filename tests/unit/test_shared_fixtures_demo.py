@@ -175,15 +175,15 @@ class TestFixturePatterns:
 
     def test_session_persistence_pattern(self, sample_session_data, temp_file):
         """Example of testing session persistence with fixtures"""
-        import pickle
+        import json
         
         # Save session data to temp file
-        with open(temp_file, 'wb') as f:
-            pickle.dump(sample_session_data, f)
+        with open(temp_file, 'w') as f:
+            json.dump(sample_session_data, f)
         
         # Load and verify
-        with open(temp_file, 'rb') as f:
-            loaded_data = pickle.load(f)
+        with open(temp_file, 'r') as f:
+            loaded_data = json.load(f)
         
         assert loaded_data == sample_session_data
         assert len(loaded_data['cookies']) == 2
@@ -29,31 +29,32 @@ class TestLoginManager(unittest.TestCase):
     
     def test_is_logged_in_success(self):
         """Test successful login detection"""
-        # Mock finding "My Account" element
-        mock_element = Mock()
-        self.mock_driver.find_elements.return_value = [mock_element]
+        # Mock finding "My Account" link
+        self.mock_driver.execute_script.return_value = {'loggedIn': True, 'hasMyAccount': True, 'hasLoginLink': False}
         
         result = self.login_handler.is_logged_in()
         self.assertTrue(result)
-        self.mock_driver.find_elements.assert_called()
+        self.mock_driver.execute_script.assert_called()
     
     def test_is_logged_in_failure(self):
         """Test login detection when not logged in"""
-        # Mock no "My Account" elements and login links present
-        self.mock_driver.find_elements.side_effect = [[], [Mock()]]  # No "My Account", has login links
+        # Mock no "My Account" link and login links present
+        self.mock_driver.execute_script.return_value = {'loggedIn': False, 'hasMyAccount': False, 'hasLoginLink': True}
         
         result = self.login_handler.is_logged_in()
         self.assertFalse(result)
     
     def test_logout_with_cookies(self):
         """Test logout fallback using cookie deletion"""
-        # Mock no logout links found, should fall back to cookies
-        self.mock_driver.find_element.side_effect = Exception("Not found")
+        # Logout page doesn't show a login link, should fall back to cookies
+        self.mock_driver.execute_script.return_value = None
+        self.mock_wait.until.side_effect = lambda condition: condition(self.mock_driver)
         
         result = self.login_handler.logout()
         self.assertTrue(result)
         self.mock_driver.delete_all_cookies.assert_called_once()
-        self.mock_driver.refresh.assert_called_once()
+        self.mock_driver.refresh.assert_not_called()
+        self.assertFalse(self.login_handler.is_logged_in())
     
     def test_sanitize_folder_name(self):
         """Test folder name sanitization"""